@@ -14,7 +14,7 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 from services.session_manager import SessionManager
 from services.file_service import FileService
-from models.consolidation_model import ConsolidationConfig
+from models.consolidation_model import ConsolidationConfig, StepSpec
 from ui.sidebar import Sidebar
 from ui.steps.step1_master_file import Step1MasterFile
 from ui.steps.step2_upload_files import Step2UploadFiles
@@ -67,7 +67,7 @@ class ConsolidationApp:
         if self.sidebar is None:
             print("[Main] ERRO: Sidebar não foi inicializado!")
             self.sidebar = Sidebar(
-                steps=[{"id": 1, "name": "Passo 1", "description": "Descrição 1"}],
+                steps=[StepSpec(id=1, name="Passo 1", description="Descrição 1")],
                 current_step=1
             )
         
@@ -91,11 +91,11 @@ class ConsolidationApp:
         """Inicializa todos os componentes da UI"""
         # Define os passos do processo
         steps = [
-            {"id": 1, "name": "Arquivo Mestre", "description": "Selecione o arquivo Excel principal"},
-            {"id": 2, "name": "Arquivos Subordinados", "description": "Carregue os arquivos para consolidação"},
-            {"id": 3, "name": "Configuração", "description": "Configure as opções de consolidação"},
-            {"id": 4, "name": "Consolidação", "description": "Execute o processo de consolidação"},
-            {"id": 5, "name": "Resultados", "description": "Visualize os resultados da consolidação"}
+            StepSpec(id=1, name="Arquivo Mestre", description="Selecione o arquivo Excel principal"),
+            StepSpec(id=2, name="Arquivos Subordinados", description="Carregue os arquivos para consolidação"),
+            StepSpec(id=3, name="Configuração", description="Configure as opções de consolidação"),
+            StepSpec(id=4, name="Consolidação", description="Execute o processo de consolidação"),
+            StepSpec(id=5, name="Resultados", description="Visualize os resultados da consolidação")
         ]
         
         print("[Init] Inicializando Sidebar...")
@@ -336,8 +336,8 @@ class ConsolidationApp:
     
     def _on_consolidation_progress(self, step_id: int, status: str, progress: float):
         """Manipula progresso da consolidação"""
+        # O Step4 agrupa os ticks e faz o próprio page.update() dos controles alterados
         self.step4.update_progress(step_id, status, progress)
-        self.content_container.update()
     
     def _on_consolidation_complete(self, result):
         """Manipula conclusão da consolidação"""
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 @dataclass
@@ -18,10 +18,17 @@ class ConsolidationConfig:
     """Configuração da consolidação"""
     master_file_path: str
     master_sheet_name: str
-    target_columns: List[str]
+    target_columns: Tuple[str, ...]
     merge_strategy: str  # 'append', 'replace', 'update'
     backup_enabled: bool = True
     
+@dataclass(frozen=True, slots=True)
+class StepSpec:
+    """Definição estática de um passo exibido no sidebar"""
+    id: int
+    name: str
+    description: str = ""
+
 @dataclass
 class ConsolidationStep:
     """Representa um passo da consolidação"""
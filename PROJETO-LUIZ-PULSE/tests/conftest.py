@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Add the project root to the Python path once for the whole test suite
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
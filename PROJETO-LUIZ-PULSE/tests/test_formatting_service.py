@@ -1,32 +1,28 @@
 import unittest
 import os
-import sys
+import shutil
+import tempfile
 import openpyxl
 from openpyxl.styles import Font, PatternFill
 
-# Add the project root to the Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, project_root)
-
 from services.formatting_service import FormattingService
 
 class TestFormattingService(unittest.TestCase):
 
-    def setUp(self):
-        self.service = FormattingService()
-        self.test_dir = "test_data"
-        os.makedirs(self.test_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        cls._template_dir = tempfile.mkdtemp()
 
         # Create a dummy master file
-        self.master_file = os.path.join(self.test_dir, "master.xlsx")
+        cls._master_template = os.path.join(cls._template_dir, "master.xlsx")
         wb_master = openpyxl.Workbook()
         ws_master = wb_master.active
         ws_master["A1"] = "Header 1"
         ws_master["B1"] = "Header 2"
-        wb_master.save(self.master_file)
+        wb_master.save(cls._master_template)
 
         # Create a dummy subordinate file with formatting
-        self.subordinate_file = os.path.join(self.test_dir, "subordinate.xlsx")
+        cls._subordinate_template = os.path.join(cls._template_dir, "subordinate.xlsx")
         wb_sub = openpyxl.Workbook()
         ws_sub = wb_sub.active
         ws_sub["A1"] = "Sub Header 1"
@@ -34,11 +30,24 @@ class TestFormattingService(unittest.TestCase):
         ws_sub["B1"] = "Sub Header 2"
         ws_sub["B1"].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
         ws_sub.column_dimensions['A'].width = 20
-        wb_sub.save(self.subordinate_file)
+        wb_sub.save(cls._subordinate_template)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._template_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.service = FormattingService()
+        self.test_dir = tempfile.mkdtemp()
+
+        # Per-test copies, since process_formatting mutates the master file
+        self.master_file = os.path.join(self.test_dir, "master.xlsx")
+        shutil.copy(self._master_template, self.master_file)
+        self.subordinate_file = os.path.join(self.test_dir, "subordinate.xlsx")
+        shutil.copy(self._subordinate_template, self.subordinate_file)
 
     def tearDown(self):
-        import shutil
-        shutil.rmtree(self.test_dir)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
 
     def test_process_formatting(self):
         # Run the formatting service
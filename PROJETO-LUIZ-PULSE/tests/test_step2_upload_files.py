@@ -0,0 +1,57 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from models.consolidation_model import FileInfo
+from ui.steps.step2_upload_files import Step2UploadFiles
+
+class _ExistingCopyFileService:
+    """File service whose move finds the copy already in place and returns the input path"""
+
+    def validate_excel_file(self, file_path):
+        return True
+
+    def move_to_subordinate_folder(self, file_path):
+        return file_path
+
+    def get_file_info(self, file_path):
+        return FileInfo(
+            name="data.xlsx",
+            path=file_path,
+            size=1024,
+            upload_time=datetime.now(),
+            sheet_names=["Sheet1"],
+            rows_count=10,
+            columns_count=3,
+        )
+
+class TestStep2UploadFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.page = MagicMock()
+        self.page.controls = []
+        self.changes = []
+        self.step = Step2UploadFiles(
+            self.page,
+            on_next_click=lambda files: None,
+            on_back_click=lambda: None,
+            on_files_change=self.changes.append,
+            file_service=_ExistingCopyFileService(),
+        )
+        self.step.build()
+
+    def test_reupload_when_move_returns_input_path(self):
+        # The existing copy makes the move return the picked path itself
+        self.step._do_processing(["/tmp/picked/data.xlsx"])
+
+        self.assertEqual([f.path for f in self.step.uploaded_files], ["/tmp/picked/data.xlsx"])
+        self.assertEqual(len(self.changes), 1)
+        self.assertFalse(self.step.next_button.disabled)
+
+    def test_same_path_picked_twice_is_added_once(self):
+        self.step._do_processing(["/tmp/picked/data.xlsx", "/tmp/picked/data.xlsx"])
+
+        self.assertEqual(len(self.step.uploaded_files), 1)
+
+if __name__ == "__main__":
+    unittest.main()
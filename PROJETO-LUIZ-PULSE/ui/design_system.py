@@ -13,139 +13,207 @@ Características:
 - Transições suaves
 """
 
-import flet as ft
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from flet import (
+    BorderSide, BoxShadow, ButtonStyle, CircleBorder, ControlState, Divider,
+    FontWeight, IconButton, Icons, Offset, ProgressRing,
+    RoundedRectangleBorder, Text, border
+)
+from copy import copy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Final, Mapping, Optional
 
 
-@dataclass
+def _with_int_colors(cls):
+    """
+    Adiciona a cada cor ``#RRGGBB`` da classe um par inteiro ``<NOME>_I``
+    
+    Permite comparar cores com um único inteiro em vez de strings;
+    valores como "transparent" ou "rgba(...)" são ignorados.
+    """
+    for name, value in list(vars(cls).items()):
+        if isinstance(value, str) and len(value) == 7 and value.startswith("#"):
+            try:
+                setattr(cls, f"{name}_I", int(value[1:], 16))
+            except ValueError:
+                continue
+    return cls
+
+
+@_with_int_colors
 class ColorPalette:
     """Paleta de cores profissional e acessível"""
     
     # Cores primárias - tons de azul corporativo
-    PRIMARY_50 = "#F0F4F8"
-    PRIMARY_100 = "#D9E2EC"
-    PRIMARY_200 = "#BCCCDC"
-    PRIMARY_300 = "#9FB3C8"
-    PRIMARY_400 = "#829AB1"
-    PRIMARY_500 = "#627D98"  # Cor principal
-    PRIMARY_600 = "#486581"
-    PRIMARY_700 = "#334E68"
-    PRIMARY_800 = "#243B53"
-    PRIMARY_900 = "#102A43"
+    PRIMARY_50: Final = "#F0F4F8"
+    PRIMARY_100: Final = "#D9E2EC"
+    PRIMARY_200: Final = "#BCCCDC"
+    PRIMARY_300: Final = "#9FB3C8"
+    PRIMARY_400: Final = "#829AB1"
+    PRIMARY_500: Final = "#627D98"  # Cor principal
+    PRIMARY_600: Final = "#486581"
+    PRIMARY_700: Final = "#334E68"
+    PRIMARY_800: Final = "#243B53"
+    PRIMARY_900: Final = "#102A43"
     
     # Cores neutras - escala de cinzas
-    NEUTRAL_50 = "#F7FAFC"
-    NEUTRAL_100 = "#EDF2F7"
-    NEUTRAL_200 = "#E2E8F0"
-    NEUTRAL_300 = "#CBD5E0"
-    NEUTRAL_400 = "#A0AEC0"
-    NEUTRAL_500 = "#718096"
-    NEUTRAL_600 = "#4A5568"
-    NEUTRAL_700 = "#2D3748"
-    NEUTRAL_800 = "#1A202C"
-    NEUTRAL_900 = "#171923"
+    NEUTRAL_50: Final = "#F7FAFC"
+    NEUTRAL_100: Final = "#EDF2F7"
+    NEUTRAL_200: Final = "#E2E8F0"
+    NEUTRAL_300: Final = "#CBD5E0"
+    NEUTRAL_400: Final = "#A0AEC0"
+    NEUTRAL_500: Final = "#718096"
+    NEUTRAL_600: Final = "#4A5568"
+    NEUTRAL_700: Final = "#2D3748"
+    NEUTRAL_800: Final = "#1A202C"
+    NEUTRAL_900: Final = "#171923"
     
     # Cores de estado
-    SUCCESS = "#38A169"
-    SUCCESS_LIGHT = "#C6F6D5"
-    WARNING = "#D69E2E"
-    WARNING_LIGHT = "#FAF089"
-    ERROR = "#E53E3E"
-    ERROR_LIGHT = "#FED7D7"
-    INFO = "#3182CE"
-    INFO_LIGHT = "#BEE3F8"
+    SUCCESS: Final = "#38A169"
+    SUCCESS_LIGHT: Final = "#C6F6D5"
+    WARNING: Final = "#D69E2E"
+    WARNING_LIGHT: Final = "#FAF089"
+    ERROR: Final = "#E53E3E"
+    ERROR_LIGHT: Final = "#FED7D7"
+    INFO: Final = "#3182CE"
+    INFO_LIGHT: Final = "#BEE3F8"
     
     # Cores de superfície
-    BACKGROUND = "#FFFFFF"
-    SURFACE = "#F7FAFC"
-    SURFACE_ELEVATED = "#FFFFFF"
-    BORDER = "#E2E8F0"
-    DIVIDER = "#CBD5E0"
+    BACKGROUND: Final = "#FFFFFF"
+    SURFACE: Final = "#F7FAFC"
+    SURFACE_ELEVATED: Final = "#FFFFFF"
+    BORDER: Final = "#E2E8F0"
+    DIVIDER: Final = "#CBD5E0"
 
 
-@dataclass
 class Typography:
     """Sistema tipográfico profissional"""
     
     # Tamanhos de fonte
-    SIZE_XS = 12
-    SIZE_SM = 14
-    SIZE_BASE = 16
-    SIZE_LG = 18
-    SIZE_XL = 20
-    SIZE_2XL = 24
-    SIZE_3XL = 30
-    SIZE_4XL = 36
+    SIZE_XS: Final = 12
+    SIZE_SM: Final = 14
+    SIZE_BASE: Final = 16
+    SIZE_LG: Final = 18
+    SIZE_XL: Final = 20
+    SIZE_2XL: Final = 24
+    SIZE_3XL: Final = 30
+    SIZE_4XL: Final = 36
     
     # Pesos de fonte
-    WEIGHT_LIGHT = ft.FontWeight.W_300
-    WEIGHT_NORMAL = ft.FontWeight.W_400
-    WEIGHT_MEDIUM = ft.FontWeight.W_500
-    WEIGHT_SEMIBOLD = ft.FontWeight.W_600
-    WEIGHT_BOLD = ft.FontWeight.W_700
+    WEIGHT_LIGHT: Final = FontWeight.W_300
+    WEIGHT_NORMAL: Final = FontWeight.W_400
+    WEIGHT_MEDIUM: Final = FontWeight.W_500
+    WEIGHT_SEMIBOLD: Final = FontWeight.W_600
+    WEIGHT_BOLD: Final = FontWeight.W_700
     
     # Altura de linha
-    LINE_HEIGHT_TIGHT = 1.25
-    LINE_HEIGHT_NORMAL = 1.5
-    LINE_HEIGHT_RELAXED = 1.75
+    LINE_HEIGHT_TIGHT: Final = 1.25
+    LINE_HEIGHT_NORMAL: Final = 1.5
+    LINE_HEIGHT_RELAXED: Final = 1.75
 
 
-@dataclass
 class Spacing:
     """Sistema de espaçamento consistente"""
     
-    XS = 4
-    SM = 8
-    BASE = 16
-    LG = 24
-    XL = 32
-    XXL = 48
-    XXXL = 64
+    XS: Final = 4
+    SM: Final = 8
+    BASE: Final = 16
+    LG: Final = 24
+    XL: Final = 32
+    XXL: Final = 48
+    XXXL: Final = 64
 
 
-@dataclass
 class BorderRadius:
     """Sistema de bordas arredondadas"""
     
-    NONE = 0
-    SM = 4
-    BASE = 8
-    LG = 12
-    XL = 16
-    FULL = 999
+    NONE: Final = 0
+    SM: Final = 4
+    BASE: Final = 8
+    LG: Final = 12
+    XL: Final = 16
+    FULL: Final = 999
 
 
-@dataclass
 class Shadows:
     """Sistema de sombras profissionais"""
     
-    NONE = "none"
-    SM = "0 1px 2px 0 rgba(0, 0, 0, 0.05)"
-    BASE = "0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)"
-    MD = "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)"
-    LG = "0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)"
-    XL = "0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)"
+    NONE: Final = "none"
+    SM: Final = "0 1px 2px 0 rgba(0, 0, 0, 0.05)"
+    BASE: Final = "0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)"
+    MD: Final = "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)"
+    LG: Final = "0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)"
+    XL: Final = "0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)"
+
+
+# Tamanho, peso e cor padrão resolvidos uma única vez por nível/tamanho
+_HEADING_RESOLVED = {
+    1: (Typography.SIZE_4XL, Typography.WEIGHT_BOLD, ColorPalette.NEUTRAL_800),
+    2: (Typography.SIZE_3XL, Typography.WEIGHT_BOLD, ColorPalette.NEUTRAL_800),
+    3: (Typography.SIZE_2XL, Typography.WEIGHT_SEMIBOLD, ColorPalette.NEUTRAL_800),
+    4: (Typography.SIZE_XL, Typography.WEIGHT_SEMIBOLD, ColorPalette.NEUTRAL_800),
+    5: (Typography.SIZE_LG, Typography.WEIGHT_MEDIUM, ColorPalette.NEUTRAL_800),
+    6: (Typography.SIZE_BASE, Typography.WEIGHT_MEDIUM, ColorPalette.NEUTRAL_800),
+}
+
+_BODY_RESOLVED = {
+    "xs": (Typography.SIZE_XS, Typography.WEIGHT_NORMAL, ColorPalette.NEUTRAL_700),
+    "sm": (Typography.SIZE_SM, Typography.WEIGHT_NORMAL, ColorPalette.NEUTRAL_700),
+    "base": (Typography.SIZE_BASE, Typography.WEIGHT_NORMAL, ColorPalette.NEUTRAL_700),
+    "lg": (Typography.SIZE_LG, Typography.WEIGHT_NORMAL, ColorPalette.NEUTRAL_700),
+    "xl": (Typography.SIZE_XL, Typography.WEIGHT_NORMAL, ColorPalette.NEUTRAL_700),
+}
+
+# Parâmetros fixos do indicador de carregamento
+_LOADING_KW = dict(stroke_width=2, color=ColorPalette.PRIMARY_600)
+
+
+# Propriedades fixas dos botões de ícone (somente leitura)
+_ICON_BUTTON_STYLE_KW = MappingProxyType(dict(overlay_color=ColorPalette.NEUTRAL_100, padding=Spacing.SM))
+
+
+def _icon_button_style() -> ButtonStyle:
+    """Estilo dos botões de ícone; um novo ButtonStyle por chamada, para não ser compartilhado"""
+    return ButtonStyle(shape=CircleBorder(), **_ICON_BUTTON_STYLE_KW)
 
 
 class DesignSystem:
     """Sistema de design centralizado"""
     
-    colors = ColorPalette()
-    typography = Typography()
-    spacing = Spacing()
-    border_radius = BorderRadius()
-    shadows = Shadows()
+    colors = ColorPalette
+    typography = Typography
+    spacing = Spacing
+    border_radius = BorderRadius
+    shadows = Shadows
     
     @staticmethod
-    def get_button_style(variant: str = "primary", size: str = "medium") -> ft.ButtonStyle:
+    def get_button_style(variant: str = "primary", size: str = "medium") -> ButtonStyle:
         """
-        Retorna estilos padronizados para botões
+        Retorna estilos padronizados para botões (um novo ButtonStyle por chamada)
         
         Args:
             variant: 'primary', 'secondary', 'outline', 'ghost'
             size: 'small', 'medium', 'large'
         """
+        props = DesignSystem._button_style_props(variant, size)
+        style = ButtonStyle(
+            bgcolor=props["bgcolor"],
+            color=props["color"],
+            overlay_color=props["overlay_color"],
+            shape=RoundedRectangleBorder(radius=DesignSystem.border_radius.BASE),
+            padding=props["padding"],
+            elevation={"": 0, ControlState.HOVERED: 2},
+        )
+        
+        if props["border"] is not None:
+            style.side = copy(props["border"])
+            
+        return style
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _button_style_props(variant: str, size: str) -> Mapping[str, Any]:
+        """Resolve (com cache) as propriedades de variante e tamanho de um botão"""
         colors = DesignSystem.colors
         spacing = DesignSystem.spacing
         
@@ -172,7 +240,7 @@ class DesignSystem:
                 "bgcolor": "transparent",
                 "color": colors.PRIMARY_600,
                 "overlay_color": colors.PRIMARY_50,
-                "border": ft.BorderSide(1, colors.PRIMARY_600)
+                "border": BorderSide(1, colors.PRIMARY_600)
             },
             "ghost": {
                 "bgcolor": "transparent",
@@ -184,63 +252,59 @@ class DesignSystem:
         size_props = size_config.get(size, size_config["medium"])
         variant_props = variant_config.get(variant, variant_config["primary"])
         
-        style = ft.ButtonStyle(
-            bgcolor=variant_props["bgcolor"],
-            color=variant_props["color"],
-            overlay_color=variant_props.get("overlay_color"),
-            shape=ft.RoundedRectangleBorder(radius=DesignSystem.border_radius.BASE),
-            padding=size_props["padding"],
-            elevation={"": 0, ft.ControlState.HOVERED: 2},
-        )
-        
-        if "border" in variant_props:
-            style.side = variant_props["border"]
-            
-        return style
+        return MappingProxyType({
+            "bgcolor": variant_props["bgcolor"],
+            "color": variant_props["color"],
+            "overlay_color": variant_props.get("overlay_color"),
+            "padding": size_props["padding"],
+            "border": variant_props.get("border"),
+        })
     
     @staticmethod
-    def get_card_style(elevated: bool = False) -> Dict[str, Any]:
+    @lru_cache(maxsize=32)
+    def get_card_style(elevated: bool = False) -> Mapping[str, Any]:
         """
-        Retorna estilos padronizados para cards
+        Retorna estilos padronizados para cards (somente leitura; use `.copy()` para alterar)
         
         Args:
             elevated: Se o card deve ter sombra elevada
         """
         colors = DesignSystem.colors
         
-        return {
+        return MappingProxyType({
             "bgcolor": colors.SURFACE_ELEVATED,
-            "border": ft.border.all(1, colors.BORDER),
+            "border": border.all(1, colors.BORDER),
             "border_radius": DesignSystem.border_radius.LG,
             "padding": DesignSystem.spacing.LG,
-            "shadow": ft.BoxShadow(
+            "shadow": BoxShadow(
                 spread_radius=0,
                 blur_radius=4 if elevated else 1,
                 color="rgba(0, 0, 0, 0.1)" if elevated else "rgba(0, 0, 0, 0.05)",
-                offset=ft.Offset(0, 2 if elevated else 1)
+                offset=Offset(0, 2 if elevated else 1)
             )
-        }
+        })
     
     @staticmethod
-    def get_input_style() -> Dict[str, Any]:
-        """Retorna estilos padronizados para campos de entrada"""
+    @lru_cache(maxsize=32)
+    def get_input_style() -> Mapping[str, Any]:
+        """Retorna estilos padronizados para campos de entrada (somente leitura)"""
         colors = DesignSystem.colors
         
-        return {
+        return MappingProxyType({
             "border_color": colors.BORDER,
             "focused_border_color": colors.PRIMARY_500,
             "bgcolor": colors.BACKGROUND,
             "border_radius": DesignSystem.border_radius.BASE,
             "content_padding": DesignSystem.spacing.BASE,
-        }
+        })
     
     @staticmethod
     def create_heading(
         text: str,
         level: int = 1,
         color: Optional[str] = None,
-        weight: Optional[ft.FontWeight] = None
-    ) -> ft.Text:
+        weight: Optional[FontWeight] = None
+    ) -> Text:
         """
         Cria um cabeçalho padronizado
         
@@ -250,32 +314,13 @@ class DesignSystem:
             color: Cor personalizada
             weight: Peso da fonte personalizado
         """
-        typography = DesignSystem.typography
-        colors = DesignSystem.colors
-        
-        size_map = {
-            1: typography.SIZE_4XL,
-            2: typography.SIZE_3XL,
-            3: typography.SIZE_2XL,
-            4: typography.SIZE_XL,
-            5: typography.SIZE_LG,
-            6: typography.SIZE_BASE
-        }
+        size_val, weight_val, color_val = _HEADING_RESOLVED.get(level, _HEADING_RESOLVED[6])
         
-        weight_map = {
-            1: typography.WEIGHT_BOLD,
-            2: typography.WEIGHT_BOLD,
-            3: typography.WEIGHT_SEMIBOLD,
-            4: typography.WEIGHT_SEMIBOLD,
-            5: typography.WEIGHT_MEDIUM,
-            6: typography.WEIGHT_MEDIUM
-        }
-        
-        return ft.Text(
+        return Text(
             text,
-            size=size_map.get(level, typography.SIZE_BASE),
-            weight=weight or weight_map.get(level, typography.WEIGHT_MEDIUM),
-            color=color or colors.NEUTRAL_800
+            size=size_val,
+            weight=weight or weight_val,
+            color=color or color_val
         )
     
     @staticmethod
@@ -283,8 +328,8 @@ class DesignSystem:
         text: str,
         size: str = "base",
         color: Optional[str] = None,
-        weight: Optional[ft.FontWeight] = None
-    ) -> ft.Text:
+        weight: Optional[FontWeight] = None
+    ) -> Text:
         """
         Cria texto de corpo padronizado
         
@@ -294,70 +339,50 @@ class DesignSystem:
             color: Cor personalizada
             weight: Peso da fonte personalizado
         """
-        typography = DesignSystem.typography
-        colors = DesignSystem.colors
-        
-        size_map = {
-            "xs": typography.SIZE_XS,
-            "sm": typography.SIZE_SM,
-            "base": typography.SIZE_BASE,
-            "lg": typography.SIZE_LG,
-            "xl": typography.SIZE_XL
-        }
+        size_val, weight_val, color_val = _BODY_RESOLVED.get(size, _BODY_RESOLVED["base"])
         
-        return ft.Text(
+        return Text(
             text,
-            size=size_map.get(size, typography.SIZE_BASE),
-            weight=weight or typography.WEIGHT_NORMAL,
-            color=color or colors.NEUTRAL_700
+            size=size_val,
+            weight=weight or weight_val,
+            color=color or color_val
         )
     
     @staticmethod
-    def create_divider(margin: int = None) -> ft.Divider:
+    def create_divider(margin: int = None) -> Divider:
         """Cria um divisor padronizado"""
         colors = DesignSystem.colors
         spacing = DesignSystem.spacing
         
-        return ft.Divider(
+        return Divider(
             height=1,
             color=colors.DIVIDER,
             thickness=1
         )
     
     @staticmethod
-    def create_loading_indicator(size: int = 24) -> ft.ProgressRing:
+    def create_loading_indicator(size: int = 24) -> ProgressRing:
         """Cria um indicador de carregamento padronizado"""
-        colors = DesignSystem.colors
-        
-        return ft.ProgressRing(
-            width=size,
-            height=size,
-            stroke_width=2,
-            color=colors.PRIMARY_600
-        )
+        return ProgressRing(width=size, height=size, **_LOADING_KW)
     
     @staticmethod
     def create_icon_button(
-        icon: ft.Icons,
+        icon: Icons,
         tooltip: str = "",
         on_click=None,
         color: Optional[str] = None,
         size: int = 24
-    ) -> ft.IconButton:
+    ) -> IconButton:
         """Cria um botão de ícone padronizado"""
         colors = DesignSystem.colors
         
-        return ft.IconButton(
+        return IconButton(
             icon=icon,
             tooltip=tooltip,
             on_click=on_click,
             icon_color=color or colors.NEUTRAL_600,
             icon_size=size,
-            style=ft.ButtonStyle(
-                shape=ft.CircleBorder(),
-                overlay_color=colors.NEUTRAL_100,
-                padding=DesignSystem.spacing.SM
-            )
+            style=_icon_button_style()
         )
 
 
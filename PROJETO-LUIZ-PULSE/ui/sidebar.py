@@ -1,8 +1,20 @@
-import flet as ft
+from flet import (
+    BoxShadow, Column, Container, CrossAxisAlignment, Divider, ElevatedButton,
+    Icon, Icons, ListView, MainAxisAlignment, Offset, Row, alignment,
+    border_radius, margin, padding
+)
 from typing import Callable, Dict, List
-from models.consolidation_model import ConsolidationStep
+from models.consolidation_model import ConsolidationStep, StepSpec
 from ui.design_system import ds
 
+# Ícone e cor de cada status de passo usados por Sidebar.update_step
+_ICON_FOR_STATUS = {
+    "completed": (Icons.CHECK_CIRCLE, ds.colors.SUCCESS, ds.colors.SUCCESS_I),
+    "error": (Icons.ERROR, ds.colors.ERROR, ds.colors.ERROR_I),
+    "running": (Icons.HOURGLASS_TOP, ds.colors.WARNING, ds.colors.WARNING_I),
+    "pending": (Icons.RADIO_BUTTON_UNCHECKED, ds.colors.NEUTRAL_500, ds.colors.NEUTRAL_500_I),
+}
+
 class Sidebar:
     """
     Componente de barra lateral com navegação em etapas
@@ -16,7 +28,7 @@ class Sidebar:
     
     def __init__(
         self,
-        steps: List[Dict],
+        steps: List[StepSpec],
         current_step: int = 1,
         on_step_click: Callable[[int], None] = None,
         on_reset: Callable[[], None] = None,
@@ -31,17 +43,17 @@ class Sidebar:
     def build(self):
         """Constrói o componente sidebar com design profissional"""
         # Cabeçalho com identidade visual sóbria
-        header = ft.Container(
-            content=ft.Column(
+        header = Container(
+            content=Column(
                 controls=[
-                    ft.Row(
+                    Row(
                         controls=[
-                            ft.Icon(
-                                ft.Icons.ANALYTICS_OUTLINED,
+                            Icon(
+                                Icons.ANALYTICS_OUTLINED,
                                 size=28,
                                 color=ds.colors.PRIMARY_400
                             ),
-                            ft.Column(
+                            Column(
                                 controls=[
                                     ds.create_heading(
                                         "Consolidador",
@@ -59,30 +71,30 @@ class Sidebar:
                             )
                         ],
                         spacing=ds.spacing.BASE,
-                        alignment=ft.MainAxisAlignment.START,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER
+                        alignment=MainAxisAlignment.START,
+                        vertical_alignment=CrossAxisAlignment.CENTER
                     ),
-                    ft.Container(
-                        content=ft.Divider(
+                    Container(
+                        content=Divider(
                             height=1,
                             color=ds.colors.PRIMARY_800,
                             thickness=1
                         ),
-                        margin=ft.margin.only(top=ds.spacing.LG)
+                        margin=margin.only(top=ds.spacing.LG)
                     )
                 ],
                 spacing=0,
                 tight=True
             ),
-            padding=ft.padding.all(ds.spacing.LG),
+            padding=padding.all(ds.spacing.LG),
         )
         print(f"[Sidebar] Header created: {type(header)}")
         
         # Lista de passos com espaçamento profissional
-        steps_list = ft.ListView(
+        steps_list = ListView(
             expand=True,
             spacing=ds.spacing.XS,
-            padding=ft.padding.symmetric(
+            padding=padding.symmetric(
                 horizontal=ds.spacing.BASE,
                 vertical=ds.spacing.SM
             )
@@ -90,40 +102,40 @@ class Sidebar:
         print(f"[Sidebar] Steps list created: {type(steps_list)}")
         
         for step in self.steps:
-            step_control = self._create_step_control(step)
-            self.step_controls[step["id"]] = step_control
-            steps_list.controls.append(step_control)
+            step_refs = self._create_step_control(step)
+            self.step_controls[step.id] = step_refs
+            steps_list.controls.append(step_refs["container"])
         
         # Adiciona print statements para debugar os controles dos passos
         for index, control in enumerate(steps_list.controls):
             print(f"[Sidebar] Step control at index {index} type: {type(control)}")
         
         # Rodapé com botão de reset profissional
-        footer = ft.Container(
-            content=ft.ElevatedButton(
-                content=ft.Row(
+        footer = Container(
+            content=ElevatedButton(
+                content=Row(
                     controls=[
-                        ft.Icon(ft.Icons.REFRESH, size=18),
+                        Icon(Icons.REFRESH, size=18),
                         ds.create_body_text(
                             "Nova Consolidação",
                             size="sm",
                             color="#FFFFFF"
                         ),
                     ],
-                    alignment=ft.MainAxisAlignment.CENTER,
+                    alignment=MainAxisAlignment.CENTER,
                     spacing=ds.spacing.SM
                 ),
                 on_click=lambda e: self._handle_reset(),
                 width=240,
                 style=ds.get_button_style("primary", "medium"),
             ),
-            padding=ft.padding.all(ds.spacing.LG),
-            alignment=ft.alignment.center,
+            padding=padding.all(ds.spacing.LG),
+            alignment=alignment.center,
         )
         print(f"[Sidebar] Footer created: {type(footer)}")
         
-        self.container = ft.Container(
-            content=ft.Column(
+        self.container = Container(
+            content=Column(
                 controls=[
                     header,
                     steps_list,
@@ -134,104 +146,128 @@ class Sidebar:
             ),
             width=300,
             bgcolor=ds.colors.PRIMARY_900,
-            border_radius=ft.border_radius.only(
+            border_radius=border_radius.only(
                 top_right=ds.border_radius.LG,
                 bottom_right=ds.border_radius.LG
             ),
-            shadow=ft.BoxShadow(
+            shadow=BoxShadow(
                 spread_radius=0,
                 blur_radius=8,
                 color="rgba(0, 0, 0, 0.15)",
-                offset=ft.Offset(2, 0)
+                offset=Offset(2, 0)
             )
         )
         return self.container
     
-    def _create_step_control(self, step: Dict):
-        try:
-            step_id = step["id"]
-            is_current = step_id == self.current_step
-            is_completed = step_id < self.current_step
-            is_accessible = step_id <= self.current_step + 1
-            
-            # Definição de cores baseada no estado
-            if is_completed:
-                icon_color = ds.colors.SUCCESS
-                text_color = ds.colors.NEUTRAL_100
-                bg_color = "transparent"
-            elif is_current:
-                icon_color = ds.colors.PRIMARY_500
-                text_color = ds.colors.PRIMARY_500
-                bg_color = ds.colors.PRIMARY_50
-            else:  # Pending
-                icon_color = ds.colors.NEUTRAL_500
-                text_color = ds.colors.NEUTRAL_500
-                bg_color = "transparent"
-            
-            # Ícone baseado no estado
-            if is_completed:
-                icon_name = ft.Icons.CHECK_CIRCLE
-            elif is_current:
-                icon_name = ft.Icons.RADIO_BUTTON_CHECKED
-            else:
-                icon_name = ft.Icons.RADIO_BUTTON_UNCHECKED
-            
-            # Container do ícone com design consistente
-            icon_container = ft.Container(
-                content=ft.Icon(
-                    icon_name,
-                    size=20,
-                    color=icon_color
-                ),
-                width=28,
-                height=28,
-                alignment=ft.alignment.center
-            )
-            
-            # Texto do passo com tipografia profissional
-            step_text = ds.create_body_text(
-                step["name"],
-                size="sm",
-                weight=ds.typography.WEIGHT_MEDIUM if is_current or is_completed else ds.typography.WEIGHT_NORMAL,
-                color=text_color
-            )
-            
-            # Descrição com design sutil
-            step_description = ds.create_body_text(
-                step.get("description", ""),
-                size="xs",
-                color=ds.colors.NEUTRAL_500 if is_current or is_completed else ds.colors.NEUTRAL_400
-            )
-            
-            # Conteúdo do passo
-            step_content = ft.Container(
-                content=ft.Row([
-                    icon_container,
-                    ft.Column([
-                        step_text,
-                        step_description
-                    ],
-                    spacing=ds.spacing.XS,
-                    tight=True)
+    def _create_step_control(self, step: StepSpec) -> Dict:
+        """
+        Cria os controles de um passo uma única vez
+        
+        Retorna as referências ao container, ícone e textos, que são
+        mutados em ``_apply_step_state`` a cada mudança de passo.
+        """
+        step_id = step.id
+        
+        icon = Icon(Icons.RADIO_BUTTON_UNCHECKED, size=20)
+        
+        # Container do ícone com design consistente
+        icon_container = Container(
+            content=icon,
+            width=28,
+            height=28,
+            alignment=alignment.center
+        )
+        
+        # Texto do passo com tipografia profissional
+        step_text = ds.create_body_text(step.name, size="sm")
+        
+        # Descrição com design sutil
+        step_description = ds.create_body_text(
+            step.description,
+            size="xs"
+        )
+        
+        # Conteúdo do passo
+        step_content = Container(
+            content=Row([
+                icon_container,
+                Column([
+                    step_text,
+                    step_description
                 ],
-                spacing=ds.spacing.SM,
-                alignment=ft.MainAxisAlignment.START,
-                vertical_alignment=ft.CrossAxisAlignment.CENTER
-            ),
-            padding=ft.padding.symmetric(
-                horizontal=ds.spacing.BASE,
-                vertical=ds.spacing.SM
-            ),
-            bgcolor=bg_color,
-            border_radius=ds.border_radius.BASE,
-            on_click=lambda e, s=step_id: self._handle_step_click(s) if is_accessible else None,
-            ink=True if is_accessible else False
-            )
-            print(f"[Sidebar] Created step control for {step['name']} type: {type(step_content)}")
-            return step_content
-        except Exception as e:
-            print(f"[Debug] Erro ao criar step control para {step['name']}: {str(e)}")
-            return ft.Container(content=ft.Text("Erro no controle do passo", color="red"))  # Retorna um controle fallback
+                spacing=ds.spacing.XS,
+                tight=True)
+            ],
+            spacing=ds.spacing.SM,
+            alignment=MainAxisAlignment.START,
+            vertical_alignment=CrossAxisAlignment.CENTER
+        ),
+        padding=padding.symmetric(
+            horizontal=ds.spacing.BASE,
+            vertical=ds.spacing.SM
+        ),
+        border_radius=ds.border_radius.BASE,
+        on_click=self._on_step_clicked,
+        data=step_id
+        )
+        
+        step_refs = {
+            "container": step_content,
+            "icon": icon,
+            "name": step_text,
+            "desc": step_description,
+            "icon_color_i": None,
+        }
+        self._apply_step_state(step_id, step_refs)
+        print(f"[Sidebar] Created step control for {step.name} type: {type(step_content)}")
+        return step_refs
+    
+    def _apply_step_state(self, step_id: int, step_refs: Dict):
+        """Aplica cores, pesos e ícone do passo conforme o passo atual"""
+        is_current = step_id == self.current_step
+        is_completed = step_id < self.current_step
+        is_accessible = step_id <= self.current_step + 1
+        
+        # Definição de cores e ícone baseada no estado
+        if is_completed:
+            icon_name = Icons.CHECK_CIRCLE
+            icon_color = ds.colors.SUCCESS
+            icon_color_i = ds.colors.SUCCESS_I
+            text_color = ds.colors.NEUTRAL_100
+            bg_color = "transparent"
+        elif is_current:
+            icon_name = Icons.RADIO_BUTTON_CHECKED
+            icon_color = ds.colors.PRIMARY_500
+            icon_color_i = ds.colors.PRIMARY_500_I
+            text_color = ds.colors.PRIMARY_500
+            bg_color = ds.colors.PRIMARY_50
+        else:  # Pending
+            icon_name = Icons.RADIO_BUTTON_UNCHECKED
+            icon_color = ds.colors.NEUTRAL_500
+            icon_color_i = ds.colors.NEUTRAL_500_I
+            text_color = ds.colors.NEUTRAL_500
+            bg_color = "transparent"
+        
+        icon = step_refs["icon"]
+        icon.name = icon_name
+        icon.color = icon_color
+        step_refs["icon_color_i"] = icon_color_i
+        
+        name_text = step_refs["name"]
+        name_text.color = text_color
+        name_text.weight = ds.typography.WEIGHT_MEDIUM if is_current or is_completed else ds.typography.WEIGHT_NORMAL
+        
+        step_refs["desc"].color = ds.colors.NEUTRAL_500 if is_current or is_completed else ds.colors.NEUTRAL_400
+        
+        container = step_refs["container"]
+        container.bgcolor = bg_color
+        container.ink = is_accessible
+    
+    def _on_step_clicked(self, e):
+        """Handler compartilhado por todos os passos; o ID vem de ``control.data``"""
+        step_id = e.control.data
+        if step_id <= self.current_step + 1:
+            self._handle_step_click(step_id)
     
     def _handle_step_click(self, step_id: int):
         """Lida com o clique em um passo"""
@@ -251,27 +287,22 @@ class Sidebar:
             step_id: ID do passo
             status: 'completed', 'error', 'running', 'pending'
         """
-        if step_id in self.step_controls:
-            step_control = self.step_controls[step_id]
-            icon_container = step_control.content.controls[0]
-            icon = icon_container.content
-            
-            # Atualiza ícone e cor baseado no status
-            if status == "completed":
-                icon.name = ft.Icons.CHECK_CIRCLE
-                icon.color = ds.colors.SUCCESS
-            elif status == "error":
-                icon.name = ft.Icons.ERROR
-                icon.color = ds.colors.ERROR
-            elif status == "running":
-                icon.name = ft.Icons.HOURGLASS_TOP
-                icon.color = ds.colors.WARNING
-            elif status == "pending":
-                icon.name = ft.Icons.RADIO_BUTTON_UNCHECKED
-                icon.color = ds.colors.NEUTRAL_500
-            
-            if self.container:
-                self.container.update()
+        pair = _ICON_FOR_STATUS.get(status)
+        if not pair or step_id not in self.step_controls:
+            return
+        
+        step_refs = self.step_controls[step_id]
+        icon = step_refs["icon"]
+        
+        # Já está no estado pedido; evita round-trip ao renderer
+        icon_name, icon_color, icon_color_i = pair
+        if icon.name == icon_name and step_refs["icon_color_i"] == icon_color_i:
+            return
+        icon.name, icon.color = icon_name, icon_color
+        step_refs["icon_color_i"] = icon_color_i
+        
+        if self.container:
+            self.container.update()
     
     def update(self):
         """Atualiza o componente"""
@@ -289,17 +320,9 @@ class Sidebar:
             old_step = self.current_step
             self.current_step = step_id
             
-            # Reconstrói os controles com os novos estados
+            # Atualiza os controles existentes com os novos estados
             for step in self.steps:
-                step_control = self._create_step_control(step)
-                self.step_controls[step["id"]] = step_control
+                self._apply_step_state(step.id, self.step_controls[step.id])
             
-            # Atualiza a lista de passos
-            if hasattr(self, 'container') and self.container:
-                steps_list = self.container.content.controls[1]  # ListView dos passos
-                steps_list.controls.clear()
-                
-                for step in self.steps:
-                    steps_list.controls.append(self.step_controls[step["id"]])
-                
-                self.container.update()
\ No newline at end of file
+            if self.container:
+                self.container.update()
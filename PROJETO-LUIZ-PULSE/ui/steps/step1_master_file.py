@@ -1,8 +1,55 @@
 import os
+import zipfile
+import xml.etree.ElementTree as ET
 import flet as ft
-from typing import Callable, List
+from functools import lru_cache
+from typing import Callable, List, Tuple
 from ui.design_system import ds
 
+# Atalhos para os tokens do design system, resolvidos uma única vez
+_COL = ds.colors
+_SP = ds.spacing
+_TY = ds.typography
+_BR = ds.border_radius
+
+# Limite de listas de opções de planilhas guardadas por Step1MasterFile
+_MAX_CACHED_OPTIONS = 16
+
+# openpyxl.load_workbook, importado apenas na primeira vez que o fallback precisar dele
+_load_workbook = None
+
+
+@lru_cache(maxsize=32)
+def _sheets_cached(file_path: str, mtime: int, size: int) -> Tuple[str, ...]:
+    """Lê os nomes das planilhas; o resultado fica em cache por (caminho, mtime, tamanho)"""
+    if file_path.lower().endswith(".xls"):
+        # on_demand lê só o stream global do BIFF e adia o parse das planilhas
+        import xlrd
+        book = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            return tuple(book.sheet_names())
+        finally:
+            book.release_resources()
+    
+    # Para .xlsx basta ler os nomes em xl/workbook.xml, sem abrir as planilhas
+    try:
+        with zipfile.ZipFile(file_path) as z, z.open("xl/workbook.xml") as f:
+            return tuple(el.get("name") for _, el in ET.iterparse(f) if el.tag.endswith("}sheet"))
+    except (KeyError, zipfile.BadZipFile):
+        pass
+    
+    # Fallback: modo read_only lê apenas a estrutura do workbook, sem carregar células
+    global _load_workbook
+    if _load_workbook is None:
+        from openpyxl import load_workbook as _load_workbook
+    # close() no finally libera o ZipFile mesmo em caso de erro (no Windows o
+    # handle aberto impediria mover o arquivo depois)
+    wb = _load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        return tuple(wb.sheetnames)
+    finally:
+        wb.close()
+
 
 class Step1MasterFile:
     """
@@ -38,43 +85,48 @@ class Step1MasterFile:
             width=400,
             disabled=True,
             on_change=self._validate_form,
-            border_color=ds.colors.BORDER,
-            focused_border_color=ds.colors.PRIMARY_500,
-            bgcolor=ds.colors.BACKGROUND,
-            border_radius=ds.border_radius.BASE,
-            content_padding=ds.spacing.BASE,
-            text_size=ds.typography.SIZE_SM
+            border_color=_COL.BORDER,
+            focused_border_color=_COL.PRIMARY_500,
+            bgcolor=_COL.BACKGROUND,
+            border_radius=_BR.BASE,
+            content_padding=_SP.BASE,
+            text_size=_TY.SIZE_SM
         )
         self.next_button = None
         self.back_button = None
         self.container = None
         self.warning_container = None
         self.file_info_container = None
+        self._last_options_by_path = {}
         
         # Adiciona o file picker à página
         page.overlay.append(self.file_picker)
     
     def build(self):
         """Constrói a interface do Step 1 com design profissional"""
+        # A árvore é estática; reentradas no passo reutilizam a mesma instância
+        if self.container is not None:
+            return self.container
+        
         # Cabeçalho da seção
         title = ds.create_heading(
             "Arquivo Mestre",
             level=2,
-            color=ds.colors.NEUTRAL_800
+            color=_COL.NEUTRAL_800
         )
         
         description = ds.create_body_text(
             "Selecione o arquivo Excel que servirá como base para a consolidação de dados. "
             "Este arquivo será usado como referência principal para o processo.",
             size="base",
-            color=ds.colors.NEUTRAL_600
+            color=_COL.NEUTRAL_600
         )
         # Aviso importante com design profissional
         warning_content = ft.Row(
             controls=[
                 ft.Icon(
                     ft.Icons.WARNING_AMBER,
-                    color=ds.colors.WARNING,
+                    color=_COL.WARNING,
                     size=24
                 ),
                 ft.Column(
@@ -82,13 +134,13 @@ class Step1MasterFile:
                         ds.create_body_text(
                             "Importante",
                             size="sm",
-                            weight=ds.typography.WEIGHT_SEMIBOLD,
-                            color=ds.colors.WARNING
+                            weight=_TY.WEIGHT_SEMIBOLD,
+                            color=_COL.WARNING
                         ),
                         ds.create_body_text(
                             "Feche todos os programas de planilhas (Excel, LibreOffice, etc.) antes de continuar.",
                             size="sm",
-                            color=ds.colors.NEUTRAL_700
+                            color=_COL.NEUTRAL_700
                         )
                     ],
                     spacing=4,
@@ -96,20 +148,19 @@ class Step1MasterFile:
                     expand=True
                 )
             ],
-            spacing=ds.spacing.BASE,
+            spacing=_SP.BASE,
             alignment=ft.MainAxisAlignment.START,
             vertical_alignment=ft.CrossAxisAlignment.START
         )
         
         self.warning_container = ft.Container(
             content=warning_content,
-            padding=ds.spacing.LG,
-            bgcolor=ds.colors.WARNING_LIGHT,
-            border=ft.border.all(1, ds.colors.WARNING),
-            border_radius=ds.border_radius.BASE,
-            margin=ft.margin.only(bottom=ds.spacing.LG)
+            padding=_SP.LG,
+            bgcolor=_COL.WARNING_LIGHT,
+            border=ft.border.all(1, _COL.WARNING),
+            border_radius=_BR.BASE,
+            margin=ft.margin.only(bottom=_SP.LG)
         )
-        print(f"[Step1] Warning container created: {type(self.warning_container)}")
         # Botão de seleção de arquivo com design profissional
         select_button = ft.ElevatedButton(
             content=ft.Row([
@@ -117,112 +168,23 @@ class Step1MasterFile:
                 ds.create_body_text(
                     "Selecionar Arquivo Excel",
                     size="sm",
-                    weight=ds.typography.WEIGHT_MEDIUM,
+                    weight=_TY.WEIGHT_MEDIUM,
                     color="#FFFFFF"
                 )
             ], 
             alignment=ft.MainAxisAlignment.CENTER,
-            spacing=ds.spacing.SM),
-            on_click=lambda _: self.file_picker.pick_files(
-                allow_multiple=False, 
-                allowed_extensions=["xlsx", "xls"]
-            ),
+            spacing=_SP.SM),
+            on_click=self._open_picker,
             width=280,
             style=ds.get_button_style("primary", "large")
         )
         # Container de informações do arquivo com design profissional
         self.file_info_container = ft.Container(
-            content=ft.Column([
-                # Cabeçalho da seção de arquivo
-                ft.Row([
-                    ft.Icon(
-                        ft.Icons.DESCRIPTION,
-                        color=ds.colors.PRIMARY_600,
-                        size=24
-                    ),
-                    ds.create_heading(
-                        "Arquivo Selecionado",
-                        level=4,
-                        color=ds.colors.PRIMARY_600
-                    )
-                ], 
-                spacing=ds.spacing.SM,
-                alignment=ft.MainAxisAlignment.START),
-                
-                ds.create_divider(),
-                
-                # Conteúdo dinâmico do arquivo
-                ft.Column(
-                    controls=[
-                        ft.Row([
-                            ft.Icon(
-                                ft.Icons.INFO_OUTLINE,
-                                color=ds.colors.NEUTRAL_400,
-                                size=20
-                            ),
-                            ds.create_body_text(
-                                "Nenhum arquivo selecionado",
-                                size="sm",
-                                color=ds.colors.NEUTRAL_500
-                            ),
-                        ], 
-                        spacing=ds.spacing.SM),
-                    ],
-                    spacing=ds.spacing.SM
-                ),
-                
-                # Seleção de planilha
-                ft.Column([
-                    ft.Row([
-                        ft.Icon(
-                            ft.Icons.TABLE_CHART,
-                            color=ds.colors.SUCCESS,
-                            size=20
-                        ),
-                        ds.create_body_text(
-                            "Planilha:",
-                            size="sm",
-                            weight=ds.typography.WEIGHT_MEDIUM,
-                            color=ds.colors.NEUTRAL_700
-                        )
-                    ], 
-                    spacing=ds.spacing.SM),
-                    
-                    self.sheet_dropdown,
-                ], 
-                spacing=ds.spacing.SM),
-                
-                # Botão de remoção
-                ft.Container(
-                    content=ft.ElevatedButton(
-                        content=ft.Row([
-                            ft.Icon(ft.Icons.DELETE_OUTLINE, size=18),
-                            ds.create_body_text(
-                                "Remover Arquivo",
-                                size="sm",
-                                color="#FFFFFF"
-                            )
-                        ], 
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        spacing=ds.spacing.SM),
-                        on_click=self._handle_delete_file,
-                        width=200,
-                        style=ft.ButtonStyle(
-                            bgcolor=ds.colors.ERROR,
-                            color="#FFFFFF",
-                            shape=ft.RoundedRectangleBorder(radius=ds.border_radius.BASE),
-                            padding=ds.spacing.BASE
-                        )
-                    ),
-                    margin=ft.margin.only(top=ds.spacing.LG)
-                )
-            ], 
-            spacing=ds.spacing.LG),
+            content=self._build_file_info_template(),
             **ds.get_card_style(elevated=True),
             width=700,
             visible=False
         )
-        print(f"[Step1] File info container created: {type(self.file_info_container)}")
         # Botões de navegação com design profissional
         self.back_button = ft.OutlinedButton(
             content=ft.Row([
@@ -230,17 +192,16 @@ class Step1MasterFile:
                 ds.create_body_text(
                     "Voltar",
                     size="sm",
-                    color=ds.colors.PRIMARY_600
+                    color=_COL.PRIMARY_600
                 )
             ], 
             alignment=ft.MainAxisAlignment.CENTER,
-            spacing=ds.spacing.SM),
+            spacing=_SP.SM),
             on_click=self._handle_back,
             width=160,
             style=ds.get_button_style("outline", "medium"),
             visible=False
         )
-        print(f"[Step1] Back button created: {type(self.back_button)}")
         
         self.next_button = ft.ElevatedButton(
             content=ft.Row([
@@ -252,17 +213,16 @@ class Step1MasterFile:
                 ft.Icon(ft.Icons.ARROW_FORWARD, size=18)
             ], 
             alignment=ft.MainAxisAlignment.CENTER,
-            spacing=ds.spacing.SM),
+            spacing=_SP.SM),
             on_click=self._handle_next,
             width=160,
             style=ds.get_button_style("primary", "medium"),
             disabled=True
         )
-        print(f"[Step1] Next button created: {type(self.next_button)}")
         # Linha de navegação
         navigation_row = ft.Row(
             [self.back_button, self.next_button], 
-            spacing=ds.spacing.LG, 
+            spacing=_SP.LG, 
             alignment=ft.MainAxisAlignment.CENTER
         )
         
@@ -274,11 +234,11 @@ class Step1MasterFile:
                     ft.Container(
                         content=ft.Column([
                             title,
-                            ft.Container(height=ds.spacing.SM),
+                            ft.Container(height=_SP.SM),
                             description
                         ]),
-                        padding=ds.spacing.LG,
-                        margin=ft.margin.only(bottom=ds.spacing.LG)
+                        padding=_SP.LG,
+                        margin=ft.margin.only(bottom=_SP.LG)
                     ),
                     
                     # Aviso
@@ -288,7 +248,7 @@ class Step1MasterFile:
                     ft.Container(
                         content=select_button,
                         alignment=ft.alignment.center,
-                        margin=ft.margin.only(bottom=ds.spacing.LG)
+                        margin=ft.margin.only(bottom=_SP.LG)
                     ),
                     
                     # Informações do arquivo
@@ -297,7 +257,7 @@ class Step1MasterFile:
                     # Navegação
                     ft.Container(
                         content=navigation_row,
-                        margin=ft.margin.only(top=ds.spacing.XL)
+                        margin=ft.margin.only(top=_SP.XL)
                     )
                 ],
                 spacing=0,
@@ -305,217 +265,239 @@ class Step1MasterFile:
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 scroll=ft.ScrollMode.AUTO
             ),
-            padding=ds.spacing.XL,
-            bgcolor=ds.colors.BACKGROUND
+            padding=_SP.XL,
+            bgcolor=_COL.BACKGROUND
         )
-        print(f"[Step1] Container created: {type(self.container)}")
         self._start_warning_animation()
         return self.container
     
-    def _handle_file_selection(self, e: ft.FilePickerResultEvent):
-        """Lida com a seleção de arquivo"""
-        if e.files and len(e.files) > 0:
-            saved_path = self.file_service.save_uploaded_file(e.files[0].path, 'mestre')
-            if saved_path and self.file_service.validate_excel_file(saved_path):
-                sheet_names = self._get_excel_sheets(saved_path)
-                if sheet_names:
-                    self.selected_file = saved_path
-                    self.sheet_dropdown.options = [ft.dropdown.Option(sheet) for sheet in sheet_names]
-                    self.sheet_dropdown.disabled = False
-                    # Atualiza o conteúdo do container com informações do arquivo
-                    file_info_content = ft.Column([
-                        # Cabeçalho da seção de arquivo
-                        ft.Row([
-                            ft.Icon(
-                                ft.Icons.DESCRIPTION,
-                                color=ds.colors.PRIMARY_600,
-                                size=24
-                            ),
-                            ds.create_heading(
-                                "Arquivo Selecionado",
-                                level=4,
-                                color=ds.colors.PRIMARY_600
-                            )
-                        ], 
-                        spacing=ds.spacing.SM,
-                        alignment=ft.MainAxisAlignment.START),
-                        
-                        ds.create_divider(),
-                        
-                        # Informações do arquivo
-                        ft.Container(
-                            content=ft.Column([
-                                ft.Row([
-                                    ft.Icon(
-                                        ft.Icons.CHECK_CIRCLE,
-                                        color=ds.colors.SUCCESS,
-                                        size=20
-                                    ),
-                                    ds.create_body_text(
-                                        f"Arquivo: {os.path.basename(saved_path)}",
-                                        size="sm",
-                                        weight=ds.typography.WEIGHT_MEDIUM,
-                                        color=ds.colors.NEUTRAL_700
-                                    )
-                                ], 
-                                spacing=ds.spacing.SM),
-                                
-                                ft.Row([
-                                    ft.Icon(
-                                        ft.Icons.FOLDER,
-                                        color=ds.colors.NEUTRAL_500,
-                                        size=18
-                                    ),
-                                    ds.create_body_text(
-                                        f"Local: {os.path.dirname(saved_path)}",
-                                        size="xs",
-                                        color=ds.colors.NEUTRAL_500
-                                    )
-                                ], 
-                                spacing=ds.spacing.SM)
-                            ], 
-                            spacing=ds.spacing.XS),
-                            padding=ds.spacing.BASE,
-                            bgcolor=ds.colors.SUCCESS_LIGHT,
-                            border_radius=ds.border_radius.BASE,
-                            border=ft.border.all(1, ds.colors.SUCCESS)
-                        ),
-                        
-                        # Seleção de planilha
-                        ft.Column([
-                            ft.Row([
-                                ft.Icon(
-                                    ft.Icons.TABLE_CHART,
-                                    color=ds.colors.SUCCESS,
-                                    size=20
-                                ),
-                                ds.create_body_text(
-                                    "Planilha:",
-                                    size="sm",
-                                    weight=ds.typography.WEIGHT_MEDIUM,
-                                    color=ds.colors.NEUTRAL_700
-                                )
-                            ], 
-                            spacing=ds.spacing.SM),
-                            
-                            self.sheet_dropdown,
-                        ], 
-                        spacing=ds.spacing.SM),
-                        
-                        # Botão de remoção
-                        ft.Container(
-                            content=ft.ElevatedButton(
-                                content=ft.Row([
-                                    ft.Icon(ft.Icons.DELETE_OUTLINE, size=18),
-                                    ds.create_body_text(
-                                        "Remover Arquivo",
-                                        size="sm",
-                                        color="#FFFFFF"
-                                    )
-                                ], 
-                                alignment=ft.MainAxisAlignment.CENTER,
-                                spacing=ds.spacing.SM),
-                                on_click=self._handle_delete_file,
-                                width=200,
-                                style=ft.ButtonStyle(
-                                    bgcolor=ds.colors.ERROR,
-                                    color="#FFFFFF",
-                                    shape=ft.RoundedRectangleBorder(radius=ds.border_radius.BASE),
-                                    padding=ds.spacing.BASE
-                                )
-                            ),
-                            margin=ft.margin.only(top=ds.spacing.LG)
-                        )
-                    ], 
-                    spacing=ds.spacing.LG)
-                    
-                    self.file_info_container.content = file_info_content
-                    self.file_info_container.visible = True
-                    self.file_info_container.update()
-                    self._validate_form()
-                else:
-                    self._show_error("Arquivo inválido ou sem planilhas.")
-            else:
-                self._show_error("Falha ao salvar arquivo mestre.")
-        else:
-            # Nenhum arquivo selecionado (cancelado)
-            pass
-    
-    def _handle_delete_file(self, e):
-        """Lida com a exclusão do arquivo selecionado"""
-        self.selected_file = None
-        self.selected_sheet = None
-        self.sheet_dropdown.options = []
-        self.sheet_dropdown.value = None
-        self.sheet_dropdown.disabled = True
+    def _build_file_info_template(self) -> ft.Column:
+        """
+        Constrói uma única vez a estrutura do painel do arquivo selecionado
         
-        # Reseta o conteúdo para o estado inicial
-        initial_content = ft.Column([
+        Guarda em ``self`` os controles mutáveis (textos, indicador de
+        carregamento e caixa de sucesso); os handlers apenas alteram
+        seus valores e visibilidade.
+        """
+        # Textos mutáveis do arquivo selecionado (atualizados nos handlers)
+        self._file_name_text = ds.create_body_text(
+            "",
+            size="sm",
+            weight=_TY.WEIGHT_MEDIUM,
+            color=_COL.NEUTRAL_700
+        )
+        self._file_path_text = ds.create_body_text(
+            "",
+            size="xs",
+            color=_COL.NEUTRAL_500
+        )
+        self._file_loading_row = ft.Row(
+            [
+                ds.create_loading_indicator(),
+                ds.create_body_text(
+                    "Carregando arquivo...",
+                    size="sm",
+                    color=_COL.NEUTRAL_600
+                )
+            ],
+            spacing=_SP.SM,
+            alignment=ft.MainAxisAlignment.CENTER,
+            visible=False
+        )
+        self._file_info_wrapper = ft.Container(
+            content=ft.Column([
+                ft.Row([
+                    ft.Icon(
+                        ft.Icons.CHECK_CIRCLE,
+                        color=_COL.SUCCESS,
+                        size=20
+                    ),
+                    self._file_name_text
+                ], 
+                spacing=_SP.SM),
+                
+                ft.Row([
+                    ft.Icon(
+                        ft.Icons.FOLDER,
+                        color=_COL.NEUTRAL_500,
+                        size=18
+                    ),
+                    self._file_path_text
+                ], 
+                spacing=_SP.SM)
+            ], 
+            spacing=_SP.XS),
+            padding=_SP.BASE,
+            bgcolor=_COL.SUCCESS_LIGHT,
+            border_radius=_BR.BASE,
+            border=ft.border.all(1, _COL.SUCCESS),
+            visible=False
+        )
+        return ft.Column([
             # Cabeçalho da seção de arquivo
             ft.Row([
                 ft.Icon(
                     ft.Icons.DESCRIPTION,
-                    color=ds.colors.PRIMARY_600,
+                    color=_COL.PRIMARY_600,
                     size=24
                 ),
                 ds.create_heading(
                     "Arquivo Selecionado",
                     level=4,
-                    color=ds.colors.PRIMARY_600
+                    color=_COL.PRIMARY_600
                 )
             ], 
-            spacing=ds.spacing.SM,
+            spacing=_SP.SM,
             alignment=ft.MainAxisAlignment.START),
             
             ds.create_divider(),
             
-            # Conteúdo dinâmico do arquivo
-            ft.Column(
-                controls=[
-                    ft.Row([
-                        ft.Icon(
-                            ft.Icons.INFO_OUTLINE,
-                            color=ds.colors.NEUTRAL_400,
-                            size=20
-                        ),
-                        ds.create_body_text(
-                            "Nenhum arquivo selecionado",
-                            size="sm",
-                            color=ds.colors.NEUTRAL_500
-                        ),
-                    ], 
-                    spacing=ds.spacing.SM),
-                ],
-                spacing=ds.spacing.SM
-            ),
+            # Indicador de carregamento
+            self._file_loading_row,
+            
+            # Informações do arquivo
+            self._file_info_wrapper,
             
             # Seleção de planilha
             ft.Column([
                 ft.Row([
                     ft.Icon(
                         ft.Icons.TABLE_CHART,
-                        color=ds.colors.SUCCESS,
+                        color=_COL.SUCCESS,
                         size=20
                     ),
                     ds.create_body_text(
                         "Planilha:",
                         size="sm",
-                        weight=ds.typography.WEIGHT_MEDIUM,
-                        color=ds.colors.NEUTRAL_700
+                        weight=_TY.WEIGHT_MEDIUM,
+                        color=_COL.NEUTRAL_700
                     )
                 ], 
-                spacing=ds.spacing.SM),
+                spacing=_SP.SM),
                 
                 self.sheet_dropdown,
             ], 
-            spacing=ds.spacing.SM),
+            spacing=_SP.SM),
+            
+            # Botão de remoção
+            ft.Container(
+                content=ft.ElevatedButton(
+                    content=ft.Row([
+                        ft.Icon(ft.Icons.DELETE_OUTLINE, size=18),
+                        ds.create_body_text(
+                            "Remover Arquivo",
+                            size="sm",
+                            color="#FFFFFF"
+                        )
+                    ], 
+                    alignment=ft.MainAxisAlignment.CENTER,
+                    spacing=_SP.SM),
+                    on_click=self._handle_delete_file,
+                    width=200,
+                    style=ft.ButtonStyle(
+                        bgcolor=_COL.ERROR,
+                        color="#FFFFFF",
+                        shape=ft.RoundedRectangleBorder(radius=_BR.BASE),
+                        padding=_SP.BASE
+                    )
+                ),
+                margin=ft.margin.only(top=_SP.LG)
+            )
         ], 
-        spacing=ds.spacing.LG)
+        spacing=_SP.LG)
+    
+    def _open_picker(self, e):
+        """Abre o seletor de arquivos Excel"""
+        self.file_picker.pick_files(
+            allow_multiple=False, 
+            allowed_extensions=["xlsx", "xls"]
+        )
+    
+    def _handle_file_selection(self, e: ft.FilePickerResultEvent):
+        """Lida com a seleção de arquivo"""
+        if e.files and len(e.files) > 0:
+            # Mostra o indicador de carregamento e processa o arquivo fora do thread da UI
+            self._file_info_wrapper.visible = False
+            self._file_loading_row.visible = True
+            self.file_info_container.visible = True
+            self.file_info_container.update()
+            self.page.run_thread(self._process_selected_file, e.files[0].path)
+        else:
+            # Nenhum arquivo selecionado (cancelado)
+            pass
+    
+    def _process_selected_file(self, file_path: str):
+        """Salva, valida e lê as planilhas do arquivo (executa em thread de trabalho)"""
+        try:
+            saved_path = self.file_service.save_uploaded_file(file_path, 'mestre')
+        except Exception as e:
+            print(f"Erro ao salvar arquivo mestre: {e}")
+            saved_path = None
+        if saved_path:
+            # Se a leitura das planilhas funcionou, o arquivo é válido; dispensa validate_excel_file
+            sheet_names = self._get_excel_sheets(saved_path)
+            if sheet_names:
+                self._apply_file_info(saved_path, sheet_names)
+                return
+            error = "Arquivo inválido ou sem planilhas."
+        else:
+            error = "Falha ao salvar arquivo mestre."
         
-        self.file_info_container.content = initial_content
+        self._file_loading_row.visible = False
         self.file_info_container.visible = False
         self.file_info_container.update()
-        self._validate_form()
+        self._show_error(error)
+    
+    def _apply_file_info(self, saved_path: str, sheet_names: List[str]):
+        """Exibe as informações do arquivo carregado"""
+        self.selected_file = saved_path
+        self.selected_sheet = None
+        self.sheet_dropdown.options = self._get_sheet_options(saved_path, sheet_names)
+        self.sheet_dropdown.value = None
+        self.sheet_dropdown.disabled = False
+        # Atualiza apenas os textos e a visibilidade dos controles já construídos
+        folder, file_name = os.path.split(saved_path)
+        self._file_name_text.value = f"Arquivo: {file_name}"
+        self._file_path_text.value = f"Local: {folder}"
+        self._file_loading_row.visible = False
+        self._file_info_wrapper.visible = True
+        self._validate_form(defer_update=True)
+        # O container já está visível desde o início do carregamento; envia só as folhas alteradas em um único update
+        self.page.update(
+            self._file_loading_row,
+            self._file_info_wrapper,
+            self.sheet_dropdown,
+            self.next_button
+        )
+    
+    def _get_sheet_options(self, saved_path: str, sheet_names: List[str]) -> List[ft.dropdown.Option]:
+        """Reutiliza as opções do dropdown quando o mesmo arquivo é selecionado de novo"""
+        # Os nomes entram na chave para que um arquivo alterado gere novas opções
+        key = (saved_path, tuple(sheet_names))
+        options = self._last_options_by_path.get(key)
+        if options is None:
+            options = [ft.dropdown.Option(sheet) for sheet in sheet_names]
+            if len(self._last_options_by_path) >= _MAX_CACHED_OPTIONS:
+                self._last_options_by_path.pop(next(iter(self._last_options_by_path)))
+            self._last_options_by_path[key] = options
+        return options
+    
+    def _handle_delete_file(self, e):
+        """Lida com a exclusão do arquivo selecionado"""
+        self._clear_selection()
+        self._validate_form(defer_update=True)
+        self.page.update()
+    
+    def _clear_selection(self):
+        """Limpa o arquivo selecionado e oculta o painel, sem reconstruí-lo"""
+        self.selected_file = None
+        self.selected_sheet = None
+        self.sheet_dropdown.options = []
+        self.sheet_dropdown.value = None
+        self.sheet_dropdown.disabled = True
+        self._file_loading_row.visible = False
+        self._file_info_wrapper.visible = False
+        self.file_info_container.visible = False
     
     def _show_error(self, message: str):
         """Exibe mensagem de erro com design profissional"""
@@ -532,8 +514,8 @@ class Step1MasterFile:
                     color="#FFFFFF"
                 )
             ], 
-            spacing=ds.spacing.SM),
-            bgcolor=ds.colors.ERROR,
+            spacing=_SP.SM),
+            bgcolor=_COL.ERROR,
             duration=4000
         )
         self.page.snack_bar.open = True
@@ -554,46 +536,37 @@ class Step1MasterFile:
         # Animação removida para compatibilidade com a versão atual do Flet
         pass
     
-    def _validate_form(self, e=None):
-        """Valida o formulário"""
+    def _validate_form(self, e=None, defer_update=False):
+        """
+        Valida o formulário
+        
+        Args:
+            e: Evento de mudança do dropdown de planilhas
+            defer_update: Se True, não atualiza a página; o chamador faz um único update no final
+        """
         if e is not None:
             self.selected_sheet = e.control.value
         if self.selected_file and self.selected_sheet:
             self.next_button.disabled = False
         else:
             self.next_button.disabled = True
-        self.page.update()
+        if not defer_update:
+            self.page.update()
     
     def _get_excel_sheets(self, file_path):
-        """Obtém as planilhas do arquivo Excel"""
+        """Obtém as planilhas do arquivo Excel; lista vazia indica arquivo inválido"""
         try:
-            import pandas as pd
-            return pd.ExcelFile(file_path).sheet_names
+            stat = os.stat(file_path)
+            # mtime/tamanho na chave invalidam o cache quando o arquivo muda
+            return list(_sheets_cached(file_path, stat.st_mtime_ns, stat.st_size))
         except Exception as e:
             print(f"Erro ao ler planilhas: {e}")
             return []
     
     def reset(self):
         """Reseta o componente ao estado inicial"""
-        self.selected_file = None
-        self.selected_sheet = None
-        self.sheet_dropdown.options = []
-        self.sheet_dropdown.value = None
-        self.sheet_dropdown.disabled = True
+        self._clear_selection()
         self.next_button.disabled = True
-        self.file_info_container.visible = False
-        self.file_info_container.content = ft.Column(
-            controls=[
-                ft.Row(
-                    controls=[
-                        ft.Icon(ft.Icons.INFO_OUTLINE, color="#03A9F4", size=18),
-                        ft.Text("Nenhum arquivo selecionado", italic=True, color="#9E9E9E"),
-                    ],
-                    spacing=15,
-                ),
-            ],
-            spacing=10,
-        )
         if self.container:
             self.container.update()
     
@@ -3,7 +3,10 @@ import sys
 # Adiciona o diretório raiz do projeto ao sys.path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from queue import Queue
+from threading import Lock, Thread
 from typing import Callable, List, Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -12,6 +15,17 @@ from services.file_service import FileService
 from models.consolidation_model import FileInfo
 from ui.design_system import ds
 
+# Altura fixa dos itens da lista: ícone de 48px + padding do card (LG) + margem inferior (SM).
+# Com uma extensão única o ListView não precisa medir os itens fora da tela.
+_CARD_HEIGHT = 48 + 2 * ds.spacing.LG
+_ITEM_EXTENT = _CARD_HEIGHT + ds.spacing.SM
+
+# Leituras de informações de arquivo executadas em paralelo pelo pipeline de upload
+_INFO_WORKERS = 4
+
+# Estilo de card não elevado, compartilhado pelo header, pelo loading e pelos cards de arquivo
+_CARD_STYLE = ds.get_card_style(elevated=False)
+
 class Step2UploadFiles:
     """
     Passo 2: Upload de arquivos subordinados
@@ -41,15 +55,46 @@ class Step2UploadFiles:
         self.on_files_change = on_files_change
         self.file_service = file_service
         self.uploaded_files: List[FileInfo] = []
-        self.file_picker = ft.FilePicker(on_result=self._process_files)
-        self.file_list = ft.ListView(expand=True, spacing=8, padding=15)
+        # Criado sob demanda no primeiro clique em selecionar arquivos
+        self.file_picker = None
+        # spacing=0: o espaço entre os cards vem da margem inferior já incluída em _ITEM_EXTENT
+        self.file_list = ft.ListView(expand=True, spacing=0, padding=15, item_extent=_ITEM_EXTENT)
         self.upload_area = self._create_upload_area()
+        # Estado padrão da área de upload, restaurado após o carregamento e no reset
+        self._default_upload_content = self.upload_area.content
+        self._default_upload_bgcolor = self.upload_area.bgcolor
+        self._default_upload_border = self.upload_area.border
+        self._loading_content = None
         self.files_header = None
+        self._summary_text = None
+        self._summary_card = self._create_summary_card()
         self.next_button = None
+        # Conteúdos do botão de avançar criados uma única vez; só o texto do estado habilitado muda
+        self._next_enabled_text = ds.create_body_text("", size="sm", color="#FFFFFF")
+        self._next_enabled_row = ft.Row([
+            self._next_enabled_text,
+            ft.Icon(ft.Icons.CHECK_CIRCLE, size=18)
+        ], 
+        alignment=ft.MainAxisAlignment.CENTER,
+        spacing=ds.spacing.SM,
+        tight=True)
+        self._next_disabled_row = ft.Row([
+            ds.create_body_text(
+                "Avançar",
+                size="sm",
+                color="#FFFFFF"
+            ),
+            ft.Icon(ft.Icons.ARROW_FORWARD, size=18)
+        ], 
+        alignment=ft.MainAxisAlignment.CENTER,
+        spacing=ds.spacing.SM,
+        tight=True)
+        # Quantidade de arquivos refletida no botão de avançar (-1 = ainda não renderizado)
+        self._last_next_count = -1
         self.back_button = None
         self.container = None
-        self.page.overlay.append(self.file_picker)
-        print("[Step2] Initialized with empty file list, FilePicker added to overlay")
+        self._container_mounted = False
+        print("[Step2] Initialized with empty file list")
 
     def build(self):
         """Constrói a interface do Step 2 com design profissional"""
@@ -104,7 +149,7 @@ class Step2UploadFiles:
             ], 
             vertical_alignment=ft.CrossAxisAlignment.CENTER),
             
-            **ds.get_card_style(elevated=False),
+            **_CARD_STYLE,
             visible=False,
             width=None  # Remover largura fixa
         )
@@ -127,20 +172,14 @@ class Step2UploadFiles:
             tooltip="Voltar para a etapa anterior"
         )
         self.next_button = ft.ElevatedButton(
-            content=ft.Row([
-                ds.create_body_text(
-                    "Avançar",
-                    size="sm",
-                    color="#FFFFFF"
-                ),
-                ft.Icon(ft.Icons.ARROW_FORWARD, size=18)
-            ], 
-            alignment=ft.MainAxisAlignment.CENTER,
-            spacing=ds.spacing.SM),
+            content=self._next_disabled_row,
             style=ds.get_button_style("primary"),
             disabled=True,
             on_click=self._handle_next
         )
+        # Botão novo: invalida o cache e sincroniza com os arquivos já carregados
+        self._last_next_count = -1
+        self._update_next_button(defer_update=True)
         
         # Linha de navegação com layout responsivo
         navigation_row = ft.Row(
@@ -208,6 +247,8 @@ class Step2UploadFiles:
             alignment=ft.alignment.center,
             expand=True
         )
+        # Novo container: ainda não foi anexado à página
+        self._container_mounted = False
         
         return self.container
 
@@ -303,28 +344,10 @@ class Step2UploadFiles:
             expand=True
         )
 
-    def _pick_files(self, e):
-        self.file_picker.pick_files(allow_multiple=True)
-
-    def _process_files(self, e: ft.FilePickerResultEvent):
-        """Processa o resultado do FilePicker e extrai os caminhos dos arquivos"""
-        if e.files:
-            file_paths = [f.path for f in e.files if f.path.endswith(('.xlsx', '.xls'))]
-            print(f"[Step2] Processando {len(file_paths)} arquivos selecionados")
-            self._process_file_paths(file_paths)
-        else:
-            print("[Step2] File selection cancelled")
-
-    def _process_file_paths(self, file_paths: List[str]):
-        # Garante que o container está na página antes de qualquer update
-        if self.container not in self.page.controls:
-            self.page.controls.append(self.container)
-            self.page.update()
-        new_files = []
-        
-        # Mostrar animação de carregamento com design profissional
-        loading_container = ft.Container(
-            content=ft.Column([
+    def _get_loading_content(self):
+        """Conteúdo de carregamento da área de upload, construído no primeiro uso"""
+        if self._loading_content is None:
+            self._loading_content = ft.Column([
                 ds.create_loading_indicator(48),
                 ft.Container(height=ds.spacing.BASE),
                 ds.create_heading(
@@ -339,54 +362,84 @@ class Step2UploadFiles:
                 )
             ], 
             alignment=ft.MainAxisAlignment.CENTER, 
-            spacing=ds.spacing.SM),
-            
-            **ds.get_card_style(elevated=False),
-            width=None,  # Remover largura fixa
-            height=280,
-            alignment=ft.alignment.center
-        )
+            spacing=ds.spacing.SM)
+        return self._loading_content
+
+    def _restore_upload_area(self):
+        """Restaura o conteúdo padrão da área de upload, sem reconstruí-lo"""
+        self.upload_area.content = self._default_upload_content
+        self.upload_area.bgcolor = self._default_upload_bgcolor
+        self.upload_area.border = self._default_upload_border
+
+    def _pick_files(self, e):
+        if self.file_picker is None:
+            self.file_picker = ft.FilePicker(on_result=self._process_files)
+            self.page.overlay.append(self.file_picker)
+            self.page.update()
+            print("[Step2] FilePicker added to overlay")
+        self.file_picker.pick_files(allow_multiple=True)
+
+    def _process_files(self, e: ft.FilePickerResultEvent):
+        """Processa o resultado do FilePicker e extrai os caminhos dos arquivos"""
+        if e.files:
+            file_paths = [f.path for f in e.files if f.path.lower().endswith(('.xlsx', '.xls'))]
+            print(f"[Step2] Processando {len(file_paths)} arquivos selecionados")
+            if not file_paths:
+                return
+            self._begin_processing(file_paths)
+        else:
+            print("[Step2] File selection cancelled")
+
+    def _begin_processing(self, file_paths: List[str]):
+        """Exibe o carregamento e agenda o processamento dos arquivos fora do thread da UI"""
+        # Sem arquivos novos não há o que carregar: evita a troca para o estado de loading
+        existing_paths = {f.path for f in self.uploaded_files}
+        if all(p in existing_paths for p in file_paths):
+            self._show_no_new_files_warning()
+            self.page.update()
+            return
         
-        # Atualizar a UI com o loading
-        original_content = self.upload_area.content
-        original_bgcolor = self.upload_area.bgcolor
-        original_border = self.upload_area.border
+        # Garante que o container está na página antes de qualquer update
+        self._ensure_container_mounted()
         
-        self.upload_area.content = loading_container.content
-        self.upload_area.bgcolor = loading_container.bgcolor
-        self.upload_area.border = loading_container.border
-        self.upload_area.update()
+        # Mostrar animação de carregamento com design profissional
+        self.upload_area.content = self._get_loading_content()
+        self.upload_area.bgcolor = _CARD_STYLE["bgcolor"]
+        self.upload_area.border = _CARD_STYLE["border"]
         self.page.update()
         
-        # Garantir que a UI seja atualizada antes de processar os arquivos
-        time.sleep(0.1)  # Pequena pausa para garantir que a UI atualize
-        
-        # Processar cada arquivo
-        new_files = []
+        # O loading já foi enviado; o processamento segue em um thread de trabalho
+        self.page.run_thread(self._do_processing, file_paths)
+
+    def _do_processing(self, file_paths: List[str]):
+        """Valida, move e carrega os arquivos e restaura a área de upload"""
+        # Processar os arquivos em pipeline: validação, cópia e leitura se sobrepõem
+        # Caminhos selecionados e caminhos já carregados ficam em conjuntos separados:
+        # o move pode devolver o próprio caminho selecionado quando a cópia já existe
+        uploaded_paths = {f.path for f in self.uploaded_files}
+        picked_paths = set()
+        pending_paths = []
         for file_path in file_paths:
-            if file_path not in [f.path for f in self.uploaded_files]:
-                # Validar se é um arquivo Excel válido
-                if not self.file_service.validate_excel_file(file_path):
-                    print(f"[Step2] Invalid Excel file: {file_path}")
-                    continue
-                
-                # Mover o arquivo para a pasta ARQUIVOS_SUBORDINADOS
-                new_path = self.file_service.move_to_subordinate_folder(file_path)
-                if new_path:
-                    # Usar o FileService para obter informações completas do arquivo
-                    file_info = self.file_service.get_file_info(new_path)
-                    if file_info:
-                        self.uploaded_files.append(file_info)
-                        new_files.append(file_info)
-                        print(f"[Step2] Added file: {new_path} - {file_info.rows_count} rows, {file_info.columns_count} columns")
-                    else:
-                        print(f"[Step2] Failed to get file info: {new_path}")
-                else:
-                    print(f"[Step2] Failed to move file: {file_path}")
+            if file_path not in uploaded_paths and file_path not in picked_paths:
+                picked_paths.add(file_path)
+                pending_paths.append(file_path)
+        new_files = []
+        if pending_paths:
+            # Percorre na ordem de seleção para manter a lista estável
+            for file_info in self._run_pipeline(pending_paths):
+                if file_info and file_info.path not in uploaded_paths:
+                    uploaded_paths.add(file_info.path)
+                    # Textos exibidos no card, calculados uma única vez por arquivo
+                    file_info._display_name = os.path.basename(file_info.path)
+                    file_info._size_mb_str = f"{file_info.size / (1024 * 1024):.2f} MB"
+                    self.uploaded_files.append(file_info)
+                    new_files.append(file_info)
+                    print(f"[Step2] Added file: {file_info.path} - {file_info.rows_count} rows, {file_info.columns_count} columns")
         
-        # Atualizar a interface para mostrar os arquivos carregados
-        self._update_file_list()
-        self._update_next_button()
+        # Atualizar a interface apenas com os cards dos novos arquivos
+        for file_info in new_files:
+            self._append_file_card(file_info, defer_update=True)
+        self._update_next_button(defer_update=True)
         
         # Criar mensagem de sucesso personalizada
         if new_files:
@@ -412,188 +465,273 @@ class Step2UploadFiles:
                 print(f"[Step2] Files ready: {len(self.uploaded_files)} files uploaded - user can proceed manually")
                 
         elif file_paths:
-            warning_message = ft.SnackBar(
-                content=ft.Row([
-                    ft.Icon(ft.Icons.WARNING_AMBER, color="#FFFFFF", size=20),
-                    ds.create_body_text(
-                        "Nenhum novo arquivo foi adicionado.",
-                        size="sm",
-                        color="#FFFFFF"
-                    )
-                ], 
-                spacing=ds.spacing.SM),
-                bgcolor=ds.colors.WARNING,
-                duration=3000
-            )
-            self.page.snack_bar = warning_message
-            self.page.snack_bar.open = True
+            self._show_no_new_files_warning()
         
         # IMPORTANTE: Restaurar a área de upload para o estado inicial
-        # Criando uma nova instância para garantir que o loading seja removido
-        new_upload_area = self._create_upload_area()
-        self.upload_area.content = new_upload_area.content
-        self.upload_area.bgcolor = new_upload_area.bgcolor
-        self.upload_area.border = new_upload_area.border
+        self._restore_upload_area()
         
-        # Atualizar apenas a página inteira para evitar erros de controles não adicionados
+        # Único update do lote: lista, botão, snackbar e área de upload juntos
         self.page.update()
         print(f"[Step2] Updated UI with {len(self.uploaded_files)} files")
 
-    def _update_file_list(self):
-        try:
-            # Garante que o container está na página antes de atualizar o ListView
-            if self.container not in self.page.controls:
-                self.page.controls.append(self.container)
-                self.page.update()
-            if hasattr(self.file_list, '_page') and self.file_list._page is not None:
-                self.file_list.controls.clear()
-                
-                # Adicionar resumo visual se houver arquivos
-                if self.uploaded_files:
-                    summary_card = ft.Container(
-                        content=ft.Row([
-                            ft.Icon(
-                                ft.Icons.CHECK_CIRCLE,
-                                color=ds.colors.SUCCESS,
-                                size=24
-                            ),
-                            ft.Column([
-                                ds.create_body_text(
-                                    f"{len(self.uploaded_files)} arquivo{'s' if len(self.uploaded_files) > 1 else ''} carregado{'s' if len(self.uploaded_files) > 1 else ''}",
-                                    size="base",
-                                    weight=ds.typography.WEIGHT_SEMIBOLD,
-                                    color=ds.colors.NEUTRAL_800
-                                ),
-                                ds.create_body_text(
-                                    "Pronto para avançar para a próxima etapa",
-                                    size="sm",
-                                    color=ds.colors.NEUTRAL_600
-                                )
-                            ], 
-                            spacing=2, 
-                            alignment=ft.MainAxisAlignment.CENTER,
-                            expand=True)
-                        ], 
-                        spacing=ds.spacing.BASE, 
-                        alignment=ft.MainAxisAlignment.START),
-                        
-                        bgcolor=ds.colors.SUCCESS_LIGHT,
-                        border=ft.border.all(1, ds.colors.SUCCESS),
-                        border_radius=ds.border_radius.BASE,
-                        padding=ds.spacing.LG,
-                        margin=ft.margin.only(bottom=ds.spacing.LG)
-                    )
-                    self.file_list.controls.append(summary_card)
-                
-                # Cards de arquivo com design profissional
-                for i, file_info in enumerate(self.uploaded_files):
-                    file_name = os.path.basename(file_info.path)
-                    file_size_mb = file_info.size / (1024 * 1024) if hasattr(file_info, 'size') else 0
-                    
-                    file_card = ft.Container(
-                        content=ft.Row([
-                            # Ícone do arquivo
-                            ft.Container(
-                                content=ft.Icon(
-                                    ft.Icons.DESCRIPTION,
-                                    color=ds.colors.PRIMARY_600,
-                                    size=24
-                                ),
-                                bgcolor=ds.colors.PRIMARY_50,
-                                border_radius=ds.border_radius.BASE,
-                                padding=ds.spacing.SM,
-                                width=48,
-                                height=48,
-                                alignment=ft.alignment.center
-                            ),
-                            # Informações do arquivo
-                            ft.Column([
-                                ds.create_body_text(
-                                    file_name,
-                                    size="sm",
-                                    weight=ds.typography.WEIGHT_MEDIUM,
-                                    color=ds.colors.NEUTRAL_800
-                                ),
-                                ds.create_body_text(
-                                    f"{file_size_mb:.2f} MB",
-                                    size="xs",
-                                    color=ds.colors.NEUTRAL_500
-                                )
-                            ],
-                            spacing=2,
-                            expand=True,
-                            alignment=ft.MainAxisAlignment.CENTER),
-                            # Botão de remoção
-                            ds.create_icon_button(
-                                icon=ft.Icons.DELETE_OUTLINE,
-                                tooltip="Remover arquivo",
-                                on_click=lambda e, idx=i: self._remove_file(idx),
-                                color=ds.colors.ERROR,
-                                size=20
-                            )
-                        ],
-                        spacing=ds.spacing.BASE,
-                        alignment=ft.MainAxisAlignment.START),
-                        **ds.get_card_style(elevated=False),
-                        margin=ft.margin.only(bottom=ds.spacing.SM)
-                    )
-                    self.file_list.controls.append(file_card)
-            
-            # Atualizar contador de arquivos de forma segura
+    def _show_no_new_files_warning(self):
+        """Exibe o aviso de que nenhum arquivo novo foi adicionado"""
+        warning_message = ft.SnackBar(
+            content=ft.Row([
+                ft.Icon(ft.Icons.WARNING_AMBER, color="#FFFFFF", size=20),
+                ds.create_body_text(
+                    "Nenhum novo arquivo foi adicionado.",
+                    size="sm",
+                    color="#FFFFFF"
+                )
+            ], 
+            spacing=ds.spacing.SM),
+            bgcolor=ds.colors.WARNING,
+            duration=3000
+        )
+        self.page.snack_bar = warning_message
+        self.page.snack_bar.open = True
+
+    def _run_pipeline(self, file_paths: List[str]) -> List[Optional[FileInfo]]:
+        """Valida, move e lê os arquivos em três estágios encadeados por filas"""
+        results: List[Optional[FileInfo]] = [None] * len(file_paths)
+        results_lock = Lock()
+        validated: Queue = Queue()
+        moved: Queue = Queue()
+        
+        def validate_stage():
+            # Validar se cada arquivo é um Excel válido
             try:
-                counter_container = self.files_header.content.controls[-1]
-                # Verificar se o container tem o atributo content e se é um Text control
-                if hasattr(counter_container, 'content') and hasattr(counter_container.content, 'value'):
-                    counter_container.content.value = f"{len(self.uploaded_files)}"
+                for index, file_path in enumerate(file_paths):
+                    try:
+                        is_valid = self.file_service.validate_excel_file(file_path)
+                    except Exception as e:
+                        print(f"[Step2] Error validating file {file_path}: {e}")
+                        continue
+                    if is_valid:
+                        validated.put((index, file_path))
+                    else:
+                        print(f"[Step2] Invalid Excel file: {file_path}")
+            finally:
+                validated.put(None)
+        
+        def move_stage():
+            # Mover os arquivos válidos para a pasta ARQUIVOS_SUBORDINADOS
+            try:
+                while (item := validated.get()) is not None:
+                    index, file_path = item
+                    try:
+                        new_path = self.file_service.move_to_subordinate_folder(file_path)
+                    except Exception as e:
+                        print(f"[Step2] Error moving file {file_path}: {e}")
+                        continue
+                    if new_path:
+                        moved.put((index, new_path))
+                    else:
+                        print(f"[Step2] Failed to move file: {file_path}")
+            finally:
+                moved.put(None)
+        
+        def read_info(index, new_path):
+            # Usar o FileService para obter informações completas do arquivo
+            try:
+                file_info = self.file_service.get_file_info(new_path)
             except Exception as e:
-                print(f"[Step2] Error updating file counter in _update_file_list: {e}")
-        except AttributeError as ae:
-            print(f"[Step2] Attribute error in _update_file_list: {ae}")
-        except Exception as ex:
-            print(f"[Step2] Error in _update_file_list: {ex}")
+                print(f"[Step2] Error reading file info {new_path}: {e}")
+                file_info = None
+            if not file_info:
+                print(f"[Step2] Failed to get file info: {new_path}")
+            with results_lock:
+                results[index] = file_info
+        
+        def info_stage():
+            # Cada arquivo movido vai para o pool assim que sai da fila, sobrepondo a leitura à cópia
+            # read_info trata as próprias falhas; o `with` aguarda todas as leituras
+            with ThreadPoolExecutor(max_workers=_INFO_WORKERS) as executor:
+                for item in iter(moved.get, None):
+                    executor.submit(read_info, *item)
+        
+        threads = [Thread(target=stage, daemon=True) for stage in (validate_stage, move_stage, info_stage)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _ensure_container_mounted(self):
+        """Garante que o container está na página antes de atualizar o ListView"""
+        if not self._container_mounted:
+            self.page.controls.append(self.container)
+            self.page.update()
+            self._container_mounted = True
+
+    def _is_file_list_mounted(self) -> bool:
+        return hasattr(self.file_list, '_page') and self.file_list._page is not None
+
+    def _create_summary_card(self):
+        """Cria o card de resumo uma única vez; depois só o texto é alterado"""
+        self._summary_text = ds.create_body_text(
+            "",
+            size="base",
+            weight=ds.typography.WEIGHT_SEMIBOLD,
+            color=ds.colors.NEUTRAL_800
+        )
+        return ft.Container(
+            content=ft.Row([
+                ft.Icon(
+                    ft.Icons.CHECK_CIRCLE,
+                    color=ds.colors.SUCCESS,
+                    size=24
+                ),
+                ft.Column([
+                    self._summary_text,
+                    ds.create_body_text(
+                        "Pronto para avançar para a próxima etapa",
+                        size="sm",
+                        color=ds.colors.NEUTRAL_600
+                    )
+                ], 
+                spacing=2, 
+                alignment=ft.MainAxisAlignment.CENTER,
+                expand=True)
+            ], 
+            spacing=ds.spacing.BASE, 
+            alignment=ft.MainAxisAlignment.START),
+            
+            bgcolor=ds.colors.SUCCESS_LIGHT,
+            border=ft.border.all(1, ds.colors.SUCCESS),
+            border_radius=ds.border_radius.BASE,
+            padding=ds.spacing.LG,
+            height=_CARD_HEIGHT,
+            margin=ft.margin.only(bottom=ds.spacing.SM)
+        )
 
-    def _update_next_button(self):
+    def _create_file_card(self, file_info: FileInfo):
+        """Cria o card de um arquivo carregado"""
+        return ft.Container(
+            content=ft.Row([
+                # Ícone do arquivo
+                ft.Container(
+                    content=ft.Icon(
+                        ft.Icons.DESCRIPTION,
+                        color=ds.colors.PRIMARY_600,
+                        size=24
+                    ),
+                    bgcolor=ds.colors.PRIMARY_50,
+                    border_radius=ds.border_radius.BASE,
+                    padding=ds.spacing.SM,
+                    width=48,
+                    height=48,
+                    alignment=ft.alignment.center
+                ),
+                # Informações do arquivo
+                ft.Column([
+                    ds.create_body_text(
+                        file_info._display_name,
+                        size="sm",
+                        weight=ds.typography.WEIGHT_MEDIUM,
+                        color=ds.colors.NEUTRAL_800
+                    ),
+                    ds.create_body_text(
+                        file_info._size_mb_str,
+                        size="xs",
+                        color=ds.colors.NEUTRAL_500
+                    )
+                ],
+                spacing=2,
+                expand=True,
+                alignment=ft.MainAxisAlignment.CENTER),
+                # Botão de remoção (identifica o arquivo pelo caminho, estável mesmo com a lista mudando)
+                ds.create_icon_button(
+                    icon=ft.Icons.DELETE_OUTLINE,
+                    tooltip="Remover arquivo",
+                    on_click=partial(self._remove_file_by_path_event, file_info.path),
+                    color=ds.colors.ERROR,
+                    size=20
+                )
+            ],
+            spacing=ds.spacing.BASE,
+            alignment=ft.MainAxisAlignment.START),
+            **_CARD_STYLE,
+            height=_CARD_HEIGHT,
+            margin=ft.margin.only(bottom=ds.spacing.SM)
+        )
+
+    def _refresh_summary(self):
+        """Atualiza o texto do resumo e o contador, inserindo/removendo o resumo conforme necessário"""
+        count = len(self.uploaded_files)
+        has_summary = bool(self.file_list.controls) and self.file_list.controls[0] is self._summary_card
+        if count and not has_summary:
+            self.file_list.controls.insert(0, self._summary_card)
+        elif not count and has_summary:
+            self.file_list.controls.pop(0)
+        self._summary_text.value = f"{count} arquivo{'s' if count > 1 else ''} carregado{'s' if count > 1 else ''}"
+        
+        # Atualizar contador de arquivos de forma segura
+        try:
+            counter_container = self.files_header.content.controls[-1]
+            # Verificar se o container tem o atributo content e se é um Text control
+            if hasattr(counter_container, 'content') and hasattr(counter_container.content, 'value'):
+                counter_container.content.value = f"{count}"
+        except Exception as e:
+            print(f"[Step2] Error updating file counter: {e}")
+
+    def _append_file_card(self, file_info: FileInfo, defer_update: bool = False):
+        """Adiciona apenas o card do novo arquivo à lista"""
+        self._ensure_container_mounted()
+        self.file_list.controls.append(self._create_file_card(file_info))
+        self._refresh_summary()
+        if not defer_update and self._is_file_list_mounted():
+            self.file_list.update()
+
+    def _remove_file_card(self, index: int, defer_update: bool = False):
+        """Remove apenas o card do arquivo no índice informado"""
+        self._ensure_container_mounted()
+        # +1 para pular o card de resumo
+        self.file_list.controls.pop(index + 1)
+        self._refresh_summary()
+        if not defer_update and self._is_file_list_mounted():
+            self.file_list.update()
+
+    def _update_next_button(self, defer_update: bool = False):
         """Atualiza o estado do botão de avançar"""
-        is_valid = len(self.uploaded_files) >= 1
+        n = len(self.uploaded_files)
+        if n == self._last_next_count:
+            return
+        self._last_next_count = n
+        is_valid = n >= 1
         self.next_button.disabled = not is_valid
         
-        # Atualizar conteúdo do botão para refletir o status
+        # Alternar entre os conteúdos pré-construídos, atualizando só a contagem
         if is_valid:
-            button_text = f"Confirmar ({len(self.uploaded_files)} arquivo{'s' if len(self.uploaded_files) > 1 else ''})"
-            button_icon = ft.Icons.CHECK_CIRCLE
+            self._next_enabled_text.value = f"Confirmar ({n} arquivo{'s' if n > 1 else ''})"
+            self.next_button.content = self._next_enabled_row
         else:
-            button_text = "Avançar"
-            button_icon = ft.Icons.ARROW_FORWARD
-        
-        # Atualizar o conteúdo do botão
-        self.next_button.content = ft.Row([
-            ds.create_body_text(
-                button_text,
-                size="sm",
-                color="#FFFFFF"
-            ),
-            ft.Icon(button_icon, size=18)
-        ], 
-        alignment=ft.MainAxisAlignment.CENTER,
-        spacing=ds.spacing.SM,
-        tight=True)  # Adicionar tight=True para melhor ajuste
+            self.next_button.content = self._next_disabled_row
         
-        # Garantir que o botão se ajuste ao conteúdo
-        
-            
-        self.page.update()
+        if not defer_update:
+            self.page.update()
         print(f"[Step2] Next button {'enabled' if is_valid else 'disabled'} - {len(self.uploaded_files)} files ready")
 
     def _remove_file(self, index: int):
         if 0 <= index < len(self.uploaded_files):
             removed_file = self.uploaded_files.pop(index)
             print(f"[Step2] Removed file: {removed_file.path}")
-            self._update_file_list()
-            self._update_next_button()
+            self._remove_file_card(index, defer_update=True)
+            self._update_next_button(defer_update=True)
+            self.page.update()
             if self.on_files_change:
                 self.on_files_change(self.uploaded_files)
                 print("[Step2] Notified listeners after removal")
 
+    def _remove_file_by_path(self, path: str):
+        idx = next((i for i, f in enumerate(self.uploaded_files) if f.path == path), -1)
+        if idx >= 0:
+            self._remove_file(idx)
+
+    def _remove_file_by_path_event(self, path: str, e):
+        self._remove_file_by_path(path)
+
     def _handle_next(self, e):
         if self.uploaded_files and self.on_next_click:
             self.on_next_click(self.uploaded_files)
@@ -621,12 +759,11 @@ class Step2UploadFiles:
         # Restaurar estado inicial
         self.files_header.visible = False
         self.next_button.disabled = True
+        self.next_button.content = self._next_disabled_row
+        self._last_next_count = 0
         
         # Garantir que a área de upload esteja no estado inicial
-        new_upload_area = self._create_upload_area()
-        self.upload_area.content = new_upload_area.content
-        self.upload_area.bgcolor = new_upload_area.bgcolor
-        self.upload_area.border = new_upload_area.border
+        self._restore_upload_area()
         
         # Atualizar apenas a página inteira para evitar erros
         self.page.update()
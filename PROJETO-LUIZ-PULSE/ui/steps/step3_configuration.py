@@ -1,8 +1,34 @@
+import logging
+import os
+from contextlib import contextmanager
 import flet as ft
-from typing import Callable, List
+from typing import Callable, Tuple
 from models.consolidation_model import ConsolidationConfig
 from ui.design_system import ds
 
+logger = logging.getLogger(__name__)
+
+# Estilo de card não elevado compartilhado pelos cards de configuração
+_CARD_STYLE = ds.get_card_style(elevated=False)
+
+# Fábricas das linhas do card do arquivo mestre (controles Flet não podem ser
+# compartilhados entre árvores, por isso cada chamada cria novas instâncias)
+def _master_header_icon() -> ft.Icon:
+    return ft.Icon(ft.Icons.INFO_OUTLINE, color=ds.colors.INFO, size=24)
+
+def _make_info_row(icon: str, text_ctrl: ft.Control) -> ft.Row:
+    return ft.Row([
+        ft.Icon(icon, color=ds.colors.NEUTRAL_500, size=20),
+        text_ctrl
+    ], 
+    spacing=ds.spacing.SM)
+
+def _make_file_row(text_ctrl: ft.Control) -> ft.Row:
+    return _make_info_row(ft.Icons.DESCRIPTION, text_ctrl)
+
+def _make_sheet_row(text_ctrl: ft.Control) -> ft.Row:
+    return _make_info_row(ft.Icons.TABLE_CHART, text_ctrl)
+
 class Step3Configuration:
     """
     Passo 3: Configuração da consolidação
@@ -19,12 +45,16 @@ class Step3Configuration:
     
     def __init__(self, page: ft.Page, on_next_click: Callable[[dict], None]):
         self.page = page
-        # Garantindo que o callback seja explicitamente armazenado
-        self.on_next_click = on_next_click
-        print(f"[Step3] Inicializado com callback: {on_next_click.__name__ if on_next_click else 'None'}")
+        # Sem callback, usa um no-op para que _handle_next não precise verificar
+        self.on_next_click = on_next_click if on_next_click is not None else (lambda config: None)
+        logger.debug("Step3 inicializado com callback: %s", on_next_click)
         self.configuration = {}
         self.master_file_path = ""
+        self._master_file_name = ""
         self.master_sheet_name = ""
+        # Última análise das colunas alvo, reaproveitada enquanto o texto não muda
+        self._last_columns_raw = None
+        self._last_columns_parsed: Tuple[str, ...] = ()
         
         # Controles da UI
         self.merge_strategy_radio = ft.RadioGroup(
@@ -69,18 +99,78 @@ class Step3Configuration:
         )
         
         self.next_button = None
+        # Estado atual do botão Consolidar; o botão é criado habilitado
+        self._next_enabled = True
         self.master_info_display = None
+        # Quando verdadeiro, os helpers não chamam .update(): o lote termina com um único page.update()
+        self._batching = False
+        # Textos do arquivo mestre, alterados in-place quando as informações mudam
+        self._file_name_text = None
+        self._sheet_name_text = None
         self.container = None
         
     def set_master_info(self, file_path: str, sheet_name: str):
         """Define as informações do arquivo mestre"""
         self.master_file_path = file_path
+        # Nome exibido calculado só quando o caminho muda
+        self._master_file_name = os.path.basename(file_path)
         self.master_sheet_name = sheet_name
         self._update_master_info_display()
         
     def build(self):
         """Constrói a interface do Step 3 com design profissional"""
-        # Cabeçalho da seção
+        # Informações do arquivo mestre com design profissional
+        # Remover border e bgcolor duplicados do card_style se existirem
+        card_style_copy = _CARD_STYLE.copy()
+        card_style_copy.pop("border", None)
+        card_style_copy.pop("bgcolor", None)
+        
+        if self.master_file_path:
+            content = self._build_master_info_content(self._master_file_name, self.master_sheet_name)
+        else:
+            content = self._build_master_info_content()
+        
+        self.master_info_display = ft.Container(
+            content=content,
+            bgcolor=ds.colors.INFO_LIGHT,
+            **card_style_copy,
+            width=700
+        )
+        
+        # Container principal com layout profissional
+        self.container = ft.Container(
+            content=ft.Column(
+                controls=[
+                    # Cabeçalho
+                    self._build_header(),
+                    
+                    # Conteúdo principal
+                    ft.Column(
+                        controls=[
+                            self.master_info_display,
+                            self._build_strategy_card(),
+                            self._build_columns_card(),
+                            self._build_backup_card()
+                        ],
+                        spacing=ds.spacing.LG,
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                    ),
+                    
+                    # Navegação
+                    self._build_nav()
+                ],
+                spacing=0,
+                expand=True,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                scroll=ft.ScrollMode.AUTO
+            ),
+            padding=ft.padding.all(ds.spacing.XL),
+            bgcolor=ds.colors.NEUTRAL_50
+        )
+        return self.container
+    
+    def _build_header(self):
+        """Cabeçalho da seção"""
         title = ds.create_heading(
             "Configuração",
             level=2,
@@ -94,75 +184,18 @@ class Step3Configuration:
             color=ds.colors.NEUTRAL_600
         )
         
-        # Informações do arquivo mestre com design profissional
-        card_style = ds.get_card_style(elevated=False)
-        card_style["bgcolor"] = ds.colors.INFO_LIGHT
-        print("[DEBUG] card_style passado ao Container:", card_style)
-        
-        # Remover border e bgcolor duplicados do card_style se existirem
-        card_style_copy = card_style.copy()
-        card_style_copy.pop("border", None)
-        card_style_copy.pop("bgcolor", None)
-        
-        self.master_info_display = ft.Container(
+        return ft.Container(
             content=ft.Column([
-                # Cabeçalho
-                ft.Row([
-                    ft.Icon(
-                        ft.Icons.INFO_OUTLINE,
-                        color=ds.colors.INFO,
-                        size=24
-                    ),
-                    ds.create_heading(
-                        "Arquivo Mestre",
-                        level=4,
-                        color=ds.colors.INFO
-                    )
-                ], 
-                spacing=ds.spacing.SM),
-                
-                ds.create_divider(),
-                
-                # Informações do arquivo
-                ft.Column([
-                    ft.Row([
-                        ft.Icon(
-                            ft.Icons.DESCRIPTION,
-                            color=ds.colors.NEUTRAL_500,
-                            size=20
-                        ),
-                        ds.create_body_text(
-                            "Arquivo: N/A",
-                            size="sm",
-                            color=ds.colors.NEUTRAL_600
-                        )
-                    ], 
-                    spacing=ds.spacing.SM),
-                    
-                    ft.Row([
-                        ft.Icon(
-                            ft.Icons.TABLE_CHART,
-                            color=ds.colors.NEUTRAL_500,
-                            size=20
-                        ),
-                        ds.create_body_text(
-                            "Planilha: N/A",
-                            size="sm",
-                            color=ds.colors.NEUTRAL_600
-                        )
-                    ], 
-                    spacing=ds.spacing.SM)
-                ], 
-                spacing=ds.spacing.SM)
-            ], 
-            spacing=ds.spacing.BASE),
-            bgcolor=ds.colors.INFO_LIGHT,
-            **card_style_copy,
-            width=700
+                title,
+                ft.Container(height=ds.spacing.SM),
+                description
+            ]),
+            margin=ft.margin.only(bottom=ds.spacing.XL)
         )
-        
-        # Card de estratégia de consolidação
-        strategy_card = ft.Container(
+    
+    def _build_strategy_card(self):
+        """Card de estratégia de consolidação"""
+        return ft.Container(
             content=ft.Column([
                 # Cabeçalho
                 ft.Row([
@@ -196,13 +229,14 @@ class Step3Configuration:
             ], 
             spacing=ds.spacing.BASE),
             
-            **ds.get_card_style(elevated=False),
+            **_CARD_STYLE,
             width=700,
             margin=ft.margin.only(bottom=ds.spacing.LG)
         )
-        
-        # Card de colunas específicas
-        columns_card = ft.Container(
+    
+    def _build_columns_card(self):
+        """Card de colunas específicas"""
+        return ft.Container(
             content=ft.Column([
                 # Cabeçalho
                 ft.Row([
@@ -237,13 +271,14 @@ class Step3Configuration:
             ], 
             spacing=ds.spacing.BASE),
             
-            **ds.get_card_style(elevated=False),
+            **_CARD_STYLE,
             width=700,
             margin=ft.margin.only(bottom=ds.spacing.LG)
         )
-        
-        # Card de opções de backup
-        backup_card = ft.Container(
+    
+    def _build_backup_card(self):
+        """Card de opções de backup"""
+        return ft.Container(
             content=ft.Column([
                 # Cabeçalho
                 ft.Row([
@@ -275,12 +310,13 @@ class Step3Configuration:
             ], 
             spacing=ds.spacing.BASE),
             
-            **ds.get_card_style(elevated=False),
+            **_CARD_STYLE,
             width=700,
             margin=ft.margin.only(bottom=ds.spacing.XL)
         )
-        
-        # Botões de navegação com design profissional
+    
+    def _build_nav(self):
+        """Botões de navegação com design profissional"""
         back_button = ft.OutlinedButton(
             content=ft.Row([
                 ft.Icon(ft.Icons.ARROW_BACK, size=20),
@@ -321,120 +357,76 @@ class Step3Configuration:
             spacing=ds.spacing.LG,
             alignment=ft.MainAxisAlignment.CENTER
         )
-        
-        # Container principal com layout profissional
-        self.container = ft.Container(
-            content=ft.Column(
-                controls=[
-                    # Cabeçalho
-                    ft.Container(
-                        content=ft.Column([
-                            title,
-                            ft.Container(height=ds.spacing.SM),
-                            description
-                        ]),
-                        margin=ft.margin.only(bottom=ds.spacing.XL)
-                    ),
-                    
-                    # Conteúdo principal
-                    ft.Column(
-                        controls=[
-                            self.master_info_display,
-                            strategy_card,
-                            columns_card,
-                            backup_card
-                        ],
-                        spacing=ds.spacing.LG,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER
-                    ),
-                    
-                    # Navegação
-                    ft.Container(
-                        content=navigation_row,
-                        margin=ft.margin.only(top=ds.spacing.XL)
-                    )
-                ],
-                spacing=0,
-                expand=True,
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                scroll=ft.ScrollMode.AUTO
-            ),
-            padding=ft.padding.all(ds.spacing.XL),
-            bgcolor=ds.colors.NEUTRAL_50
+        return ft.Container(
+            content=navigation_row,
+            margin=ft.margin.only(top=ds.spacing.XL)
         )
-        return self.container
+    
+    def _build_master_info_content(self, file_name: str = "N/A", sheet_name: str = "N/A") -> ft.Column:
+        """
+        Cria o conteúdo do card do arquivo mestre. É a única construção da árvore:
+        atualizações e reset apenas alteram os textos guardados aqui.
+        """
+        self._file_name_text = ds.create_body_text("", size="sm")
+        self._sheet_name_text = ds.create_body_text("", size="sm")
+        self._set_master_info_texts(file_name, sheet_name)
+        
+        return ft.Column([
+            # Cabeçalho
+            ft.Row([
+                _master_header_icon(),
+                ds.create_heading(
+                    "Arquivo Mestre",
+                    level=4,
+                    color=ds.colors.INFO
+                )
+            ], 
+            spacing=ds.spacing.SM),
+            
+            ds.create_divider(),
+            
+            # Informações do arquivo
+            ft.Column([
+                _make_file_row(self._file_name_text),
+                _make_sheet_row(self._sheet_name_text)
+            ], 
+            spacing=ds.spacing.SM)
+        ], 
+        spacing=ds.spacing.BASE)
+    
+    def _set_master_info_texts(self, file_name: str = "N/A", sheet_name: str = "N/A"):
+        """Aplica arquivo e planilha aos textos existentes, destacando valores reais"""
+        if self._file_name_text is None:
+            return
+        
+        is_default = file_name == "N/A"
+        color = ds.colors.NEUTRAL_600 if is_default else ds.colors.NEUTRAL_700
+        weight = ds.typography.WEIGHT_NORMAL if is_default else ds.typography.WEIGHT_MEDIUM
+        for text, value in (
+            (self._file_name_text, f"Arquivo: {file_name}"),
+            (self._sheet_name_text, f"Planilha: {sheet_name}"),
+        ):
+            text.value = value
+            text.color = color
+            text.weight = weight
     
     def _update_master_info_display(self):
         """
-        Atualiza a exibição das informações do arquivo mestre
-        com design profissional e informações atualizadas.
+        Atualiza a exibição das informações do arquivo mestre,
+        alterando apenas os textos de arquivo e planilha.
         """
         if not self.master_file_path or not self.master_info_display:
             return
-            
-        import os
-        file_name = os.path.basename(self.master_file_path)
         
-        # Atualiza o conteúdo com design profissional
-        if self.master_info_display is not None:
-            self.master_info_display.content = ft.Column([
-                # Cabeçalho
-                ft.Row([
-                    ft.Icon(
-                        ft.Icons.INFO_OUTLINE,
-                        color=ds.colors.INFO,
-                        size=24
-                    ),
-                    ds.create_heading(
-                        "Arquivo Mestre",
-                        level=4,
-                        color=ds.colors.INFO
-                    )
-                ], 
-                spacing=ds.spacing.SM),
-                
-                ds.create_divider(),
-                
-                # Informações do arquivo
-                ft.Column([
-                    ft.Row([
-                        ft.Icon(
-                            ft.Icons.DESCRIPTION,
-                            color=ds.colors.NEUTRAL_500,
-                            size=20
-                        ),
-                        ds.create_body_text(
-                            f"Arquivo: {file_name}",
-                            size="sm",
-                            color=ds.colors.NEUTRAL_700,
-                            weight=ds.typography.WEIGHT_MEDIUM
-                        )
-                    ], 
-                    spacing=ds.spacing.SM),
-                    
-                    ft.Row([
-                        ft.Icon(
-                            ft.Icons.TABLE_CHART,
-                            color=ds.colors.NEUTRAL_500,
-                            size=20
-                        ),
-                        ds.create_body_text(
-                            f"Planilha: {self.master_sheet_name}",
-                            size="sm",
-                            color=ds.colors.NEUTRAL_700,
-                            weight=ds.typography.WEIGHT_MEDIUM
-                        )
-                    ], 
-                    spacing=ds.spacing.SM)
-                ], 
-                spacing=ds.spacing.SM)
-            ], 
-            spacing=ds.spacing.BASE)
-            
-            try:
-                self.master_info_display.update()
-            except Exception as e:
-                print(f"Erro ao atualizar display do arquivo mestre: {e}")
+        self._set_master_info_texts(self._master_file_name, self.master_sheet_name)
+        if self._batching:
+            return
+        
+        try:
+            self._file_name_text.update()
+            self._sheet_name_text.update()
+        except Exception as e:
+            logger.warning("Erro ao atualizar display do arquivo mestre: %s", e)
     
     def _on_strategy_change(self, e):
         """Lida com mudança na estratégia de consolidação"""
@@ -443,16 +435,18 @@ class Step3Configuration:
     def _validate_form(self, e=None):
         """Valida o formulário e habilita/desabilita o botão próximo"""
         # Por enquanto, sempre válido já que todos os campos são opcionais
-        if self.next_button:
-            self.next_button.disabled = False
+        new_val = True
+        if new_val == self._next_enabled or not self.next_button:
+            return
+        self.next_button.disabled = not new_val
+        self._next_enabled = new_val
+        if not self._batching:
             self.next_button.update()
     
     def _handle_next(self, e):
         """Lida com o clique no botão próximo"""
         # Processa as colunas alvo
-        target_columns = []
-        if self.target_columns_text.value and self.target_columns_text.value.strip():
-            target_columns = [col.strip() for col in self.target_columns_text.value.split(',')]
+        target_columns = self._parse_target_columns()
         
         # Cria a configuração
         config = ConsolidationConfig(
@@ -463,76 +457,58 @@ class Step3Configuration:
             backup_enabled=self.backup_checkbox.value,
         )
         
-        # Adicionar logs para debug
-        print(f"[Step3] Botão Consolidar clicado, config: {config}")
-        print(f"[Step3] on_next_click existe? {hasattr(self, 'on_next_click')}")
-        print(f"[Step3] on_next_click é callable? {callable(self.on_next_click) if hasattr(self, 'on_next_click') else False}")
+        logger.debug("Step3 botão Consolidar clicado, config: %s", config)
         
         # Notifica o controle pai
-        if hasattr(self, 'on_next_click') and self.on_next_click:
-            print(f"[Step3] Chamando on_next_click: {self.on_next_click.__name__ if hasattr(self.on_next_click, '__name__') else 'sem nome'}")
-            self.on_next_click(config)
-        else:
-            print("[Step3] ERRO: on_next_click não está definido ou é None")
+        self.on_next_click(config)
+    
+    def _parse_target_columns(self) -> Tuple[str, ...]:
+        """Converte o texto de colunas alvo em tupla, reaproveitando a última análise"""
+        raw = self.target_columns_text.value
+        if not raw or not raw.strip():
+            return ()
+        if raw != self._last_columns_raw:
+            self._last_columns_parsed = tuple(c for c in map(str.strip, raw.split(',')) if c)
+            self._last_columns_raw = raw
+        return self._last_columns_parsed
     
     def _handle_back(self, e):
         """Lida com o clique no botão voltar"""
         # Implementar navegação para trás se necessário
         pass
     
+    @contextmanager
+    def _batch_updates(self):
+        """Agrupa as alterações de UI feitas no bloco em um único page.update()"""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self.container:
+                self.page.update()
+    
     def reset(self):
         """Reseta o componente ao estado inicial"""
-        self.master_file_path = ""
-        self.master_sheet_name = ""
-        
-        if self.merge_strategy_radio:
-            self.merge_strategy_radio.value = "append"
-        
-        if self.backup_checkbox:
-            self.backup_checkbox.value = True
-        
-        if self.target_columns_text:
-            self.target_columns_text.value = ""
-        
-        if self.next_button:
-            self.next_button.disabled = False
+        with self._batch_updates():
+            self.master_file_path = ""
+            self._master_file_name = ""
+            self.master_sheet_name = ""
             
-        if self.master_info_display:
-            self.master_info_display.content = ft.Column(
-                controls=[
-                    ft.Row(
-                        controls=[
-                            ft.Icon(ft.Icons.INFO_OUTLINE, color="#2196F3", size=20),
-                            ft.Text("Informações do arquivo mestre", weight=ft.FontWeight.BOLD, color="#2196F3")
-                        ],
-                        spacing=10,
-                    ),
-                    ft.Divider(height=10, color="#B2E6CE"),
-                    ft.Column(
-                        controls=[
-                            ft.Row(
-                                controls=[
-                                    ft.Icon(ft.Icons.INSERT_DRIVE_FILE, color="#03A9F4", size=18),
-                                    ft.Text("Arquivo: N/A", italic=True, color="#757575"),
-                                ],
-                                spacing=10,
-                            ),
-                            ft.Row(
-                                controls=[
-                                    ft.Icon(ft.Icons.TABLE_CHART, color="#689F38", size=18),
-                                    ft.Text("Planilha: N/A", italic=True, color="#757575"),
-                                ],
-                                spacing=10,
-                            ),
-                        ],
-                        spacing=5,
-                    ),
-                ],
-                spacing=10,
-            )
-        
-        if self.container:
-            self.container.update()
+            if self.merge_strategy_radio:
+                self.merge_strategy_radio.value = "append"
+            
+            if self.backup_checkbox:
+                self.backup_checkbox.value = True
+            
+            if self.target_columns_text:
+                self.target_columns_text.value = ""
+            
+            if self.next_button:
+                self.next_button.disabled = False
+            self._next_enabled = True
+                
+            self._set_master_info_texts()
     
     def update(self):
         """Atualiza o componente"""
@@ -1,19 +1,60 @@
+import logging
+import queue
+import threading
 import flet as ft
 from typing import Callable, Optional
-from models.consolidation_model import ConsolidationResult, ConsolidationStep
+from models.consolidation_model import ConsolidationResult, ConsolidationStep, StepSpec
 from ui.design_system import ds
 
+logger = logging.getLogger(__name__)
+
+# Intervalo (s) em que os ticks de progresso são agrupados em um único page.update()
+_FLUSH_INTERVAL = 0.06
+
+# Passos da consolidação (estáticos, compartilhados entre instâncias)
+CONSOLIDATION_STEPS = (
+    StepSpec(id=1, name="Validação", description="Validando arquivos e configurações"),
+    StepSpec(id=2, name="Preparação", description="Preparando arquivos para consolidação"),
+    StepSpec(id=3, name="Leitura", description="Lendo dados dos arquivos subordinados"),
+    StepSpec(id=4, name="Consolidação", description="Consolidando dados na planilha mestre"),
+    StepSpec(id=5, name="Formatação", description="Aplicando formatação das planilhas subordinadas"),
+    StepSpec(id=6, name="Backup e Finalização", description="Criando backup e finalizando processo"),
+)
+_STEPS_BY_ID = {step.id: step for step in CONSOLIDATION_STEPS}
+_NUM_STEPS = len(CONSOLIDATION_STEPS)
+
+# Descritores de layout dos containers de passo (imutáveis, compartilhados entre os passos)
+_STEP_PADDING = ft.padding.all(ds.spacing.BASE)
+_STEP_MARGIN = ft.margin.only(bottom=ds.spacing.SM)
+_STEP_BORDER = ft.border.all(1, ds.colors.BORDER)
+
+
+def _assign_changed(control, **attrs) -> bool:
+    """Atribui apenas os valores que mudaram; retorna se algo foi alterado"""
+    changed = False
+    for name, value in attrs.items():
+        if getattr(control, name) != value:
+            setattr(control, name, value)
+            changed = True
+    return changed
+
 class Step4Consolidation:
     """Passo 4: Execução da consolidação"""
     
+    # Ícones de status dos passos
+    _ICON_DONE = ft.Icons.CHECK_CIRCLE
+    _ICON_RUN = ft.Icons.HOURGLASS_TOP
+    _ICON_IDLE = ft.Icons.RADIO_BUTTON_UNCHECKED
+    
     def __init__(self, page: ft.Page, on_consolidation_complete: Callable[[ConsolidationResult], None], on_next_click: Callable[[], None]):
         self.page = page
         self.on_consolidation_complete = on_consolidation_complete
         self.on_next_click = on_next_click
         self.start_callback = None
         
-        # Estado da consolidação
+        # Estado da consolidação; is_running é verificado e marcado sob _start_lock
         self.is_running = False
+        self._start_lock = threading.Lock()
         self.is_completed = False
         self.result = None
         
@@ -41,20 +82,28 @@ class Step4Consolidation:
             weight="bold",
             color=ds.colors.NEUTRAL_800
         )
-        self.next_button_container = ft.Container(visible=False)  # Container para botão de próximo passo
+        self.next_button_container = None  # Container do botão de próximo passo, criado no build()
         self.step_progress_bars = {}
         self.step_status_texts = {}
+        self.step_icons = {}
+        # Coluna dos passos, preenchida só no primeiro início da consolidação
+        self._steps_column = None
+        self._steps_built = False
+        # Soma dos valores das barras dos passos, mantida incrementalmente
+        self._progress_sum = 0.0
+        # Último (progresso, status) aceito por passo, para descartar ticks irrelevantes
+        self._last_reported = {}
+        # Área de progresso já exibida; evita repetir as atribuições de visibilidade a cada tick
+        self._progress_ui_visible = False
         self.container = None
         
-        # Passos da consolidação
-        self.consolidation_steps = [
-            {"id": 1, "name": "Validação", "description": "Validando arquivos e configurações"},
-            {"id": 2, "name": "Preparação", "description": "Preparando arquivos para consolidação"},
-            {"id": 3, "name": "Leitura", "description": "Lendo dados dos arquivos subordinados"},
-            {"id": 4, "name": "Consolidação", "description": "Consolidando dados na planilha mestre"},
-            {"id": 5, "name": "Formatação", "description": "Aplicando formatação das planilhas subordinadas"},
-            {"id": 6, "name": "Backup e Finalização", "description": "Criando backup e finalizando processo"},
-        ]
+        # Agrupamento dos updates de progresso: no máximo um timer armado por vez
+        self._pending_update = False
+        self._update_lock = threading.Lock()
+        
+        # Ticks publicados pelo worker; aplicados em lote por _drain_progress
+        self._progress_queue = queue.Queue()
+        self._drain_lock = threading.Lock()
         
     def set_start_callback(self, callback: Callable[[], None]):
         """Define o callback para iniciar a consolidação"""
@@ -62,34 +111,45 @@ class Step4Consolidation:
         
     def build(self):
         """Constrói a interface da etapa de consolidação"""
-        print("[Step4] Iniciando build() da Step4")
+        logger.debug("Step4 iniciando build() da Step4")
+        # Atalhos locais para os tokens do design system usados dezenas de vezes
+        colors = ds.colors
+        spacing = ds.spacing
+        radius = ds.border_radius
+        pad = ft.padding
         try:
             # Reseta o estado para iniciar limpo
-            print("[Step4] Resetando estado inicial...")
+            logger.debug("Step4 resetando estado inicial...")
             self.reset()  
             
+            # Os controles dos passos pertencem ao build anterior; serão recriados sob demanda
+            self.step_progress_bars.clear()
+            self.step_status_texts.clear()
+            self.step_icons.clear()
+            self._steps_built = False
+            
             # Título e descrição da etapa
-            print("[Step4] Criando cabeçalho...")
+            logger.debug("Step4 criando cabeçalho...")
             header_container = ft.Container(
                 content=ft.Column([
                     ds.create_heading("Consolidação", "Executar processo de consolidação"),
                     ds.create_body_text(
                         "Inicie o processo de consolidação dos arquivos subordinados no arquivo mestre.",
                         size="md",
-                        color=ds.colors.NEUTRAL_700
+                        color=colors.NEUTRAL_700
                     ),
-                ], spacing=ds.spacing.SM),
-                padding=ft.padding.all(ds.spacing.LG),
-                bgcolor=ds.colors.BACKGROUND,
-                border_radius=ds.border_radius.LG,
-                border=ft.border.all(1, ds.colors.NEUTRAL_200)
+                ], spacing=spacing.SM),
+                padding=pad.all(spacing.LG),
+                bgcolor=colors.BACKGROUND,
+                border_radius=radius.LG,
+                border=ft.border.all(1, colors.NEUTRAL_200)
             )
             
             # Botão para iniciar a consolidação - MUITO IMPORTANTE
-            print("[Step4] Criando botão de início...")
+            logger.debug("Step4 criando botão de início...")
             self.start_button = ft.ElevatedButton(
                 content=ft.Row([
-                    ft.Icon(name=ft.icons.PLAY_ARROW, color="#FFFFFF"),
+                    ft.Icon(name=ft.Icons.PLAY_ARROW, color="#FFFFFF"),
                     ft.Text(value="Iniciar Consolidação", color="#FFFFFF"),
                 ], alignment=ft.MainAxisAlignment.CENTER),
                 style=ds.get_button_style("primary", "large"),
@@ -105,10 +165,10 @@ class Step4Consolidation:
                 content=ft.Row([
                     self.start_button
                 ], alignment=ft.MainAxisAlignment.CENTER),
-                padding=ft.padding.all(ds.spacing.LG),
-                bgcolor=ds.colors.BACKGROUND,
-                border_radius=ds.border_radius.LG,
-                border=ft.border.all(1, ds.colors.NEUTRAL_200),
+                padding=pad.all(spacing.LG),
+                bgcolor=colors.BACKGROUND,
+                border_radius=radius.LG,
+                border=ft.border.all(1, colors.NEUTRAL_200),
                 # Forçando visibilidade do container
                 visible=True
             )
@@ -117,12 +177,34 @@ class Step4Consolidation:
             debug_text = ds.create_body_text(
                 "Interface de consolidação carregada. Clique no botão acima para iniciar.",
                 size="sm",
-                color=ds.colors.SUCCESS,
+                color=colors.SUCCESS,
                 italic=True
             )
             
+            # Passos da consolidação: a coluna começa vazia e é preenchida em _handle_start
+            self._steps_column = ft.Column([], spacing=spacing.MD, tight=True)
+            
+            # Botão para o próximo passo: criado uma vez, exibido apenas após sucesso
+            self.next_button_container = ft.Container(
+                content=ft.Row([
+                    ft.ElevatedButton(
+                        content=ft.Row([
+                            ft.Text("Ver Resultados", size=16, weight=ft.FontWeight.W_500, color="#FFFFFF"),
+                            ft.Icon(ft.Icons.ARROW_FORWARD, size=20, color="#FFFFFF")
+                        ], 
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        tight=True),
+                        on_click=self._handle_next,
+                        style=ds.get_button_style("primary", "medium"),
+                        width=200
+                    )
+                ], alignment=ft.MainAxisAlignment.CENTER),
+                margin=ft.margin.only(top=spacing.LG),
+                visible=False
+            )
+            
             # Container para o progresso global da consolidação (inicialmente oculto)
-            print("[Step4] Criando containers de progresso...")
+            logger.debug("Step4 criando containers de progresso...")
             self.progress_container = ft.Container(
                 visible=False,  # Inicialmente oculto
                 content=ft.Column([
@@ -131,63 +213,64 @@ class Step4Consolidation:
                         "Progresso da consolidação",
                         size="lg",
                         weight="bold",
-                        color=ds.colors.NEUTRAL_900
+                        color=colors.NEUTRAL_900
                     ),
-                    ft.Container(height=ds.spacing.MD),
+                    ft.Container(height=spacing.MD),
                     
                     # Barra de progresso global
                     self.overall_progress,
-                    ft.Container(height=ds.spacing.XS),
+                    ft.Container(height=spacing.XS),
                     
                     # Status do progresso
                     ft.Row([
                         self.status_text,
-                        ft.Container(width=ds.spacing.SM),
+                        ft.Container(width=spacing.SM),
                     ]),
-                    ft.Container(height=ds.spacing.LG),
+                    ft.Container(height=spacing.LG),
                     
                     # Passos da consolidação
-                    ft.Column(self._build_progress_steps(), spacing=ds.spacing.MD, tight=True)
+                    self._steps_column,
+                    
+                    # Próximo passo
+                    self.next_button_container
                 ]),
-                padding=ft.padding.all(ds.spacing.LG),
-                bgcolor=ds.colors.BACKGROUND,
-                border_radius=ds.border_radius.LG,
-                border=ft.border.all(1, ds.colors.NEUTRAL_200)
+                padding=pad.all(spacing.LG),
+                bgcolor=colors.BACKGROUND,
+                border_radius=radius.LG,
+                border=ft.border.all(1, colors.NEUTRAL_200)
             )
             
             # Estrutura principal
-            print("[Step4] Montando container principal...")
+            logger.debug("Step4 montando container principal...")
             main_container = ft.Container(
                 content=ft.Column([
                     header_container,
-                    ft.Container(height=ds.spacing.MD),
+                    ft.Container(height=spacing.MD),
                     start_button_container,
                     ft.Container(
                         content=ft.Row([debug_text], alignment=ft.MainAxisAlignment.CENTER),
-                        padding=ft.padding.symmetric(vertical=ds.spacing.SM)
+                        padding=pad.symmetric(vertical=spacing.SM)
                     ),
-                    ft.Container(height=ds.spacing.MD),
+                    ft.Container(height=spacing.MD),
                     self.progress_container,
                 ], spacing=0, tight=True),
-                padding=ft.padding.all(ds.spacing.LG),
-                bgcolor=ds.colors.SURFACE,
+                padding=pad.all(spacing.LG),
+                bgcolor=colors.SURFACE,
                 expand=True,
-                border_radius=ds.border_radius.LG,
+                border_radius=radius.LG,
                 scroll=ft.ScrollMode.AUTO  # Adiciona scroll para garantir visibilidade em telas pequenas
             )
             
-            print("[Step4] build() concluído com sucesso")
+            logger.debug("Step4 build() concluído com sucesso")
             return main_container
         except Exception as e:
-            print(f"[Step4] ERRO ao construir UI: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Step4 erro ao construir UI: %s", e)
             # Retorna uma mensagem de erro visível para o usuário
             return ft.Container(
                 content=ft.Column([
-                    ft.Icon(name=ft.icons.ERROR_OUTLINE, color=ds.colors.ERROR, size=48),
-                    ft.Text("Erro ao carregar a interface de consolidação", color=ds.colors.ERROR),
-                    ft.Text(f"Detalhes: {str(e)}", size=12, color=ds.colors.NEUTRAL_600),
+                    ft.Icon(name=ft.Icons.ERROR_OUTLINE, color=colors.ERROR, size=48),
+                    ft.Text("Erro ao carregar a interface de consolidação", color=colors.ERROR),
+                    ft.Text(f"Detalhes: {str(e)}", size=12, color=colors.NEUTRAL_600),
                     ft.Container(height=20),
                     ft.ElevatedButton(
                         "Tentar novamente",
@@ -201,30 +284,33 @@ class Step4Consolidation:
     
     def _build_progress_steps(self):
         """Constrói os controles de progresso para cada passo"""
+        colors = ds.colors
+        spacing = ds.spacing
+        radius = ds.border_radius
         steps_controls = []
         
-        for step in self.consolidation_steps:
-            step_id = step["id"]
+        for step in CONSOLIDATION_STEPS:
+            step_id = step.id
             
             # Ícone do status com design profissional
             status_icon = ft.Icon(
-                ft.Icons.RADIO_BUTTON_UNCHECKED,
-                color=ds.colors.NEUTRAL_400,
+                self._ICON_IDLE,
+                color=colors.NEUTRAL_400,
                 size=20,
             )
             
             # Texto do passo com tipografia padronizada
             step_title = ds.create_body_text(
-                f"{step_id}. {step['name']}",
+                f"{step_id}. {step.name}",
                 size="base",
                 weight=ft.FontWeight.W_600,
-                color=ds.colors.NEUTRAL_800
+                color=colors.NEUTRAL_800
             )
             
             step_description = ds.create_body_text(
-                step["description"],
+                step.description,
                 size="sm",
-                color=ds.colors.NEUTRAL_600
+                color=colors.NEUTRAL_600
             )
             
             # Barra de progresso individual
@@ -233,150 +319,219 @@ class Step4Consolidation:
                 height=4,
                 value=0,
                 visible=True,
-                bgcolor=ds.colors.NEUTRAL_200,
-                color=ds.colors.SUCCESS,
-                border_radius=ds.border_radius.SM
+                bgcolor=colors.NEUTRAL_200,
+                color=colors.SUCCESS,
+                border_radius=radius.SM
             )
             
             # Texto de status
             status_text = ds.create_body_text(
                 "Aguardando...",
                 size="xs",
-                color=ds.colors.NEUTRAL_500
+                color=colors.NEUTRAL_500
             )
             
             # Armazena referências
             self.step_progress_bars[step_id] = progress_bar
             self.step_status_texts[step_id] = status_text
+            self.step_icons[step_id] = status_icon
             
             # Container do passo com design profissional
             step_container = ft.Container(
                 content=ft.Row([
                     status_icon,
-                    ft.Container(width=ds.spacing.BASE),
+                    ft.Container(width=spacing.BASE),
                     ft.Column([
                         step_title,
                         step_description,
-                        ft.Container(height=ds.spacing.SM),
+                        ft.Container(height=spacing.SM),
                         progress_bar,
-                        ft.Container(height=ds.spacing.XS),
+                        ft.Container(height=spacing.XS),
                         status_text,
                     ], 
                     spacing=0,
                     expand=True),
                 ], 
                 alignment=ft.MainAxisAlignment.START),
-                padding=ft.padding.all(ds.spacing.BASE),
-                margin=ft.margin.only(bottom=ds.spacing.SM),
-                bgcolor=ds.colors.BACKGROUND,
-                border_radius=ds.border_radius.BASE,
-                border=ft.border.all(1, ds.colors.BORDER),
+                padding=_STEP_PADDING,
+                margin=_STEP_MARGIN,
+                bgcolor=colors.BACKGROUND,
+                border_radius=radius.BASE,
+                border=_STEP_BORDER,
             )
             
-            # Armazena referência do ícone para atualizações
-            setattr(step_container, 'status_icon', status_icon)
-            
             steps_controls.append(step_container)
         
         return steps_controls
     
     def _handle_start(self, e):
         """Inicia o processo de consolidação"""
-        print("[Step4] Botão 'Iniciar Consolidação' clicado")
-        if self.start_callback and not self.is_running and not self.is_completed:
-            # Atualiza estado
+        logger.debug("Step4 botão 'Iniciar Consolidação' clicado")
+        # Guarda de execução: cliques concorrentes não iniciam uma segunda consolidação
+        with self._start_lock:
+            if not self.start_callback or self.is_running or self.is_completed:
+                return
             self.is_running = True
-            
-            # Atualiza UI - oculta botão e mostra progresso
-            self.start_button.visible = False
-            self.overall_progress.visible = True
-            self.status_text.visible = True
-            self.progress_container.visible = True
-            
-            # Inicializa barras de progresso
-            for step_id in self.step_progress_bars:
-                self.step_progress_bars[step_id].value = 0
-                self.step_status_texts[step_id].value = "Aguardando..."
-                self.step_status_texts[step_id].color = ds.colors.NEUTRAL_500
-            
-            # Força atualização da UI antes de iniciar a consolidação
-            print("[Step4] Atualizando UI antes de iniciar consolidação")
-            self.page.update()
-            
-            # Inicia consolidação com pequeno delay para garantir UI atualizada
-            print("[Step4] Chamando start_callback para iniciar consolidação")
-            # Usar thread para não bloquear a UI
-            import threading, time
-            def delayed_start():
-                time.sleep(0.5)  # Pequeno delay para garantir que a UI seja atualizada
-                self.start_callback()
-            
-            thread = threading.Thread(target=delayed_start)
-            thread.daemon = True
-            thread.start()
+        
+        # Constrói os passos na primeira execução deste build
+        if not self._steps_built:
+            self._steps_column.controls.extend(self._build_progress_steps())
+            self._steps_built = True
+        
+        # Atualiza UI - oculta botão e mostra progresso
+        self._ensure_progress_visible()
+        
+        # Inicializa barras de progresso
+        self._progress_sum = 0.0
+        self._last_reported.clear()
+        for step_id in self.step_progress_bars:
+            self.step_progress_bars[step_id].value = 0
+            self.step_status_texts[step_id].value = "Aguardando..."
+            self.step_status_texts[step_id].color = ds.colors.NEUTRAL_500
+        
+        # Força atualização da UI antes de iniciar a consolidação.
+        # O container de progresso inclui a barra geral, o status e os passos.
+        logger.debug("Step4 atualizando UI antes de iniciar consolidação")
+        self.page.update(self.start_button, self.progress_container)
+        
+        # O update acima já foi enviado; o callback dispara a consolidação em seu
+        # próprio thread e retorna em seguida
+        logger.debug("Step4 chamando start_callback para iniciar consolidação")
+        try:
+            self.start_callback()
+        except Exception as e:
+            logger.exception("Step4 erro ao iniciar consolidação: %s", e)
+            self.is_running = False
     
     def update_progress(self, step_id: int, status: str, progress: float):
         """Atualiza o progresso de um passo específico"""
-        print(f"[Step4] Atualizando progresso: step_id={step_id}, status={status}, progress={progress}")
+        # Ignora ticks com variação < 1% no mesmo passo e status; início e fim sempre passam
+        last_progress, last_status = self._last_reported.get(step_id, (-1, None))
+        if 0 < progress < 100 and status == last_status and abs(progress - last_progress) < 1.0:
+            return
+        self._last_reported[step_id] = (progress, status)
         
-        # Garante que os elementos de progresso estão visíveis
-        self.overall_progress.visible = True
-        self.status_text.visible = True
-        self.progress_container.visible = True
-        self.start_button.visible = False
+        # Publica o tick; os controles são alterados no flush, junto com os demais
+        self._progress_queue.put_nowait((step_id, status, progress))
+        self._schedule_flush()
+    
+    def _drain_progress(self) -> list:
+        """
+        Aplica os ticks pendentes, mantendo apenas o mais recente de cada passo,
+        e retorna os controles alterados (sem repetição).
+        """
+        changed = {}
+        with self._drain_lock:
+            latest = {}
+            while True:
+                try:
+                    step_id, status, progress = self._progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # Reinsere para que a ordem reflita o tick mais recente
+                latest.pop(step_id, None)
+                latest[step_id] = (status, progress)
+            for step_id, (status, progress) in latest.items():
+                for control in self._apply_progress(step_id, status, progress):
+                    changed[id(control)] = control
+        return list(changed.values())
+    
+    def _apply_progress(self, step_id: int, status: str, progress: float) -> list:
+        """Aplica um tick de progresso e retorna os controles que precisam ser enviados"""
+        logger.debug("Step4 atualizando progresso: step_id=%s, status=%s, progress=%s", step_id, status, progress)
+        
+        # Garante que os elementos de progresso estão visíveis (caso não tenha passado por _handle_start)
+        changed = [] if self._progress_ui_visible else self._ensure_progress_visible()
         
         if step_id in self.step_progress_bars:
             progress_bar = self.step_progress_bars[step_id]
             status_text = self.step_status_texts[step_id]
+            icon = self.step_icons[step_id]
             
-            # Atualiza barra de progresso
-            progress_bar.value = progress / 100.0
+            # Atualiza barra de progresso (e a soma pela diferença)
+            new_value = progress / 100.0
+            old_value = progress_bar.value or 0
+            if new_value != old_value:
+                self._progress_sum += new_value - old_value
+                progress_bar.value = new_value
+                changed.append(progress_bar)
             
-            # Atualiza texto de status
-            status_text.value = status
-            
-            # Atualiza ícone baseado no progresso
-            step_container = progress_bar.parent.parent.parent
-            if hasattr(step_container, 'status_icon'):
-                icon = step_container.status_icon
-                if progress >= 100:
-                    icon.name = ft.Icons.CHECK_CIRCLE
-                    icon.color = ds.colors.SUCCESS
-                    status_text.color = ds.colors.SUCCESS
-                elif progress > 0:
-                    icon.name = ft.Icons.HOURGLASS_TOP
-                    icon.color = ds.colors.WARNING
-                    status_text.color = ds.colors.WARNING
+            # Atualiza texto de status e ícone baseado no progresso
+            if progress >= 100:
+                icon_name, color = self._ICON_DONE, ds.colors.SUCCESS
+            elif progress > 0:
+                icon_name, color = self._ICON_RUN, ds.colors.WARNING
+            else:
+                icon_name, color = icon.name, status_text.color
+            if _assign_changed(status_text, value=status, color=color):
+                changed.append(status_text)
+            if _assign_changed(icon, name=icon_name, color=color if progress > 0 else icon.color):
+                changed.append(icon)
             
             # Atualiza progresso geral
-            total_progress = sum(bar.value for bar in self.step_progress_bars.values()) / len(self.step_progress_bars)
-            self.overall_progress.value = total_progress
+            total_progress = self._progress_sum / _NUM_STEPS
+            if _assign_changed(self.overall_progress, value=total_progress):
+                changed.append(self.overall_progress)
             
             # Atualiza status geral
             if total_progress >= 1.0:
-                self.status_text.value = "Consolidação concluída com sucesso!"
-                self.status_text.color = ds.colors.SUCCESS
+                status_changed = _assign_changed(
+                    self.status_text,
+                    value="Consolidação concluída com sucesso!",
+                    color=ds.colors.SUCCESS
+                )
             else:
-                current_step = next((s for s in self.consolidation_steps if s["id"] == step_id), None)
-                if current_step:
-                    self.status_text.value = f"Executando: {current_step['name']}..."
-        
-        # Força atualização da UI
+                current_step = _STEPS_BY_ID.get(step_id)
+                status_changed = bool(current_step) and _assign_changed(
+                    self.status_text,
+                    value=f"Executando: {current_step.name}..."
+                )
+            if status_changed:
+                changed.append(self.status_text)
+        return changed
+    
+    def _ensure_progress_visible(self) -> list:
+        """Exibe a área de progresso e oculta o botão de início; retorna os controles alterados"""
+        self.overall_progress.visible = True
+        self.status_text.visible = True
+        self.progress_container.visible = True
+        self.start_button.visible = False
+        self._progress_ui_visible = True
+        return [self.progress_container, self.start_button]
+    
+    def _schedule_flush(self):
+        """Arma um único timer para enviar as alterações pendentes"""
+        with self._update_lock:
+            if self._pending_update:
+                return
+            self._pending_update = True
+        timer = threading.Timer(_FLUSH_INTERVAL, self._flush_update)
+        timer.daemon = True
+        timer.start()
+    
+    def _flush_update(self):
+        """Envia de uma vez todas as alterações de progresso acumuladas"""
+        with self._update_lock:
+            self._pending_update = False
+        controls = self._drain_progress()
+        if not controls:
+            return
         try:
-            self.page.update()
-            print(f"[Step4] UI atualizada com sucesso para step_id={step_id}")
+            self.page.update(*controls)
+            logger.debug("Step4 UI atualizada com o progresso acumulado")
         except Exception as e:
-            print(f"[Step4] Erro ao atualizar UI: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Step4 erro ao atualizar UI: %s", e)
     
     def on_consolidation_finished(self, result: ConsolidationResult):
         """Chamado quando a consolidação é finalizada"""
-        print(f"[Step4] Consolidação finalizada: success={result.success}, rows_added={result.total_rows_added}")
+        logger.debug("Step4 consolidação finalizada: success=%s, rows_added=%s", result.success, result.total_rows_added)
         self.is_running = False
         self.is_completed = True
         self.result = result
         
+        # Aplica os ticks ainda pendentes para que não sobrescrevam o status final
+        controls = self._drain_progress()
+        
         # Atualiza status final
         if result.success:
             self.status_text.value = f"Consolidação concluída! {result.total_rows_added} linhas adicionadas."
@@ -385,45 +540,23 @@ class Step4Consolidation:
             self.status_text.value = "Consolidação falhou. Verifique os erros."
             self.status_text.color = ds.colors.ERROR
         
-        # Adiciona botão para próximo passo com design profissional
-        if result.success:
-            next_button = ft.ElevatedButton(
-                content=ft.Row([
-                    ft.Text("Ver Resultados", size=16, weight=ft.FontWeight.W_500, color="#FFFFFF"),
-                    ft.Icon(ft.Icons.ARROW_FORWARD, size=20, color="#FFFFFF")
-                ], 
-                alignment=ft.MainAxisAlignment.CENTER,
-                tight=True),
-                on_click=self._handle_next,
-                style=ds.get_button_style("primary", "medium"),
-                width=200
-            )
-            
-            # Container para o botão de próximo
-            next_container = ft.Container(
-                content=ft.Row([
-                    next_button
-                ], alignment=ft.MainAxisAlignment.CENTER),
-                margin=ft.margin.only(top=ds.spacing.LG)
-            )
-            
-            # Adiciona o botão ao layout
-            # Acessa a coluna principal dentro do container de progresso
-            main_column = self.progress_container.content
-            main_column.controls.append(next_container)
+        # Exibe o botão para o próximo passo
+        if self.next_button_container:
+            self.next_button_container.visible = result.success
         
-        # Atualiza a UI
+        # Atualiza a UI: ticks pendentes, status final e botão de próximo passo
+        controls.append(self.status_text)
+        if self.next_button_container:
+            controls.append(self.next_button_container)
         try:
-            self.page.update()
-            print("[Step4] UI atualizada após finalização da consolidação")
+            self.page.update(*controls)
+            logger.debug("Step4 UI atualizada após finalização da consolidação")
         except Exception as e:
-            print(f"[Step4] Erro ao atualizar UI após finalização: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Step4 erro ao atualizar UI após finalização: %s", e)
     
     def _handle_next(self, e):
         """Lida com o clique no botão próximo"""
-        print("[Step4] Botão 'Ver Resultados' clicado")
+        logger.debug("Step4 botão 'Ver Resultados' clicado")
         if self.on_next_click:
             self.on_next_click()
     
@@ -440,6 +573,10 @@ class Step4Consolidation:
 
         if self.progress_container:
             self.progress_container.visible = False
+        self._progress_ui_visible = False
+        
+        if self.next_button_container:
+            self.next_button_container.visible = False
         
         if self.overall_progress:
             self.overall_progress.value = 0
@@ -448,7 +585,12 @@ class Step4Consolidation:
             self.status_text.value = "Aguardando início da consolidação..."
             self.status_text.color = ds.colors.NEUTRAL_600
         
-        # Reseta progresso dos passos
+        # Reseta progresso dos passos (descartando ticks ainda não aplicados)
+        with self._drain_lock:
+            while not self._progress_queue.empty():
+                self._progress_queue.get_nowait()
+        self._progress_sum = 0.0
+        self._last_reported.clear()
         for step_id in self.step_progress_bars:
             progress_bar = self.step_progress_bars[step_id]
             status_text = self.step_status_texts[step_id]
@@ -458,17 +600,15 @@ class Step4Consolidation:
             status_text.color = ds.colors.NEUTRAL_500
             
             # Reseta ícones
-            step_container = progress_bar.parent.parent.parent
-            if hasattr(step_container, 'status_icon'):
-                icon = step_container.status_icon
-                icon.name = ft.icons.RADIO_BUTTON_UNCHECKED
-                icon.color = ds.colors.NEUTRAL_400
+            icon = self.step_icons[step_id]
+            icon.name = self._ICON_IDLE
+            icon.color = ds.colors.NEUTRAL_400
         
-        # Atualiza a UI
+        # Atualiza apenas os controles deste passo (nada a enviar antes do primeiro build)
         try:
-            self.page.update()
-            print("[Step4] Componente resetado com sucesso")
+            controls = tuple(c for c in (self.start_button, self.progress_container) if c is not None)
+            if controls:
+                self.page.update(*controls)
+            logger.debug("Step4 componente resetado com sucesso")
         except Exception as e:
-            print(f"[Step4] Erro ao resetar componente: {e}")
-            import traceback
-            traceback.print_exc()
\ No newline at end of file
+            logger.exception("Step4 erro ao resetar componente: %s", e)
\ No newline at end of file
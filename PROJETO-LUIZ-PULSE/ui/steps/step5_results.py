@@ -1,8 +1,105 @@
+import logging
 import flet as ft
 import os
+from functools import lru_cache
 from typing import Callable, Optional
 from models.consolidation_model import ConsolidationResult
 
+logger = logging.getLogger(__name__)
+
+# Cartões de estatística: (chave, título, ícone, cor)
+_STAT_CARDS = (
+    ("files", "Arquivos Processados", ft.Icons.FOLDER_OPEN, "#1976D2"),
+    ("rows", "Linhas Adicionadas", ft.Icons.ADD_BOX, "#4CAF50"),
+    ("time", "Tempo de Execução", ft.Icons.TIMER, "#FF9800"),
+    ("fmt", "Formatação", ft.Icons.PALETTE, "#9C27B0"),
+)
+
+# Descritores de layout imutáveis, compartilhados entre as renderizações
+_PADDING_15 = ft.padding.all(15)
+_PADDING_20 = ft.padding.all(20)
+_PADDING_30 = ft.padding.all(30)
+_BORDER_GREY = ft.border.all(1, "#E0E0E0")
+_BORDER_NEUTRAL = ft.border.all(1, "#CFD8DC")
+_BORDER_SUCCESS = ft.border.all(2, "#C8E6C9")
+_BORDER_BACKUP = ft.border.all(1, "#FFD700")
+_BORDER_ERROR_HEADER = ft.border.all(2, "#FFCDD2")
+_BORDER_ERROR = ft.border.all(1, "#FFCDD2")
+_SHAPE_R8 = {ft.ControlState.DEFAULT: ft.RoundedRectangleBorder(radius=8)}
+_STAT_CARD_STYLE = {
+    "padding": _PADDING_20,
+    "bgcolor": "#FFFFFF",
+    "border_radius": 10,
+    "border": _BORDER_GREY,
+    "width": 150,
+    "height": 120,
+}
+
+# Ícone e cor por status de passo; demais status usam _STEP_ICON_DEFAULT
+_STEP_ICON_SPECS = {
+    "completed": (ft.Icons.CHECK_CIRCLE, "#4CAF50"),
+    "error": (ft.Icons.ERROR, "#F44336"),
+}
+_STEP_ICON_DEFAULT = (ft.Icons.RADIO_BUTTON_UNCHECKED, "#9E9E9E")
+
+# Altura máxima das listas de passos/erros e altura estimada de cada linha
+_LIST_MAX_HEIGHT = 200
+_LIST_ROW_EXTENT = 24
+
+
+def _lazy_list(items, spacing: int) -> ft.ListView:
+    """Lista virtualizada: apenas as linhas visíveis são construídas no cliente"""
+    return ft.ListView(
+        controls=items,
+        spacing=spacing,
+        height=min(_LIST_MAX_HEIGHT, len(items) * (_LIST_ROW_EXTENT + spacing)),
+    )
+
+
+def _build_step_row(step) -> ft.Row:
+    """Linha de resumo de um passo: ícone de status, nome e progresso"""
+    icon_name, icon_color = _STEP_ICON_SPECS.get(step.status, _STEP_ICON_DEFAULT)
+    return ft.Row(
+        controls=[
+            ft.Icon(icon_name, color=icon_color, size=16),
+            ft.Text(f"{step.id}. {step.name}", size=12),
+            ft.Text(f"({step.progress:.0f}%)", size=11, color="#757575"),
+        ],
+        spacing=8,
+    )
+
+
+def _step_items(step):
+    """Controles de um passo: a linha de resumo e, se houver, a mensagem de erro"""
+    row = _build_step_row(step)
+    if not step.error_message:
+        return (row,)
+    return (
+        row,
+        ft.Text(
+            f"   Erro: {step.error_message}",
+            size=11,
+            color="#F44336",
+            italic=True,
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_opener():
+    """Resolve (uma única vez, sob demanda) o comando que abre pastas no sistema"""
+    import platform
+    import subprocess
+    
+    system = platform.system()
+    if system == "Windows":
+        return subprocess, ("explorer",), {
+            "creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+        }
+    
+    command = ("open",) if system == "Darwin" else ("xdg-open",)  # macOS / Linux
+    return subprocess, command, {"close_fds": True, "start_new_session": True}
+
 class Step5Results:
     """Passo 5: Exibição dos resultados da consolidação"""
     
@@ -15,6 +112,33 @@ class Step5Results:
         self.results_container = None
         self.container = None
         
+        # Estado vazio e cartões de estatística (construídos uma vez e reutilizados)
+        self._empty_state_column = ft.Column(
+            controls=[
+                ft.Row(
+                    controls=[
+                        ft.Icon(ft.Icons.INFO_OUTLINE, color="#42A5F5", size=18),
+                        ft.Text("Os resultados serão exibidos aqui após a consolidação", 
+                               italic=True, color="#9E9E9E"),
+                    ],
+                    spacing=10,
+                ),
+            ],
+            spacing=10,
+        )
+        self._stat_value_refs = {
+            key: ft.Text("", size=20, weight=ft.FontWeight.BOLD, color=color)
+            for key, _, _, color in _STAT_CARDS
+        }
+        self._stats_row = ft.Row(
+            controls=[
+                self._create_stat_card(title, self._stat_value_refs[key], icon, color)
+                for key, title, icon, color in _STAT_CARDS
+            ],
+            spacing=15,
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+        
     def build(self):
         # Título e descrição
         title = ft.Text("5. Resultados da Consolidação", size=20, weight=ft.FontWeight.BOLD)
@@ -26,23 +150,11 @@ class Step5Results:
         
         # Container para os resultados
         self.results_container = ft.Container(
-            content=ft.Column(
-                controls=[
-                    ft.Row(
-                        controls=[
-                            ft.Icon(ft.Icons.INFO_OUTLINE, color="#42A5F5", size=18),
-                            ft.Text("Os resultados serão exibidos aqui após a consolidação", 
-                                   italic=True, color="#9E9E9E"),
-                        ],
-                        spacing=10,
-                    ),
-                ],
-                spacing=10,
-            ),
-            padding=ft.padding.all(20),
+            content=self._empty_state_column,
+            padding=_PADDING_20,
             bgcolor="#ECEFF1",
             border_radius=10,
-            border=ft.border.all(1, "#CFD8DC"),
+            border=_BORDER_NEUTRAL,
         )
         
         # Botões de ação
@@ -58,9 +170,7 @@ class Step5Results:
             width=200,
             height=45,
             style=ft.ButtonStyle(
-                shape={
-                    ft.ControlState.DEFAULT: ft.RoundedRectangleBorder(radius=8),
-                },
+                shape=_SHAPE_R8,
                 padding=10,
                 bgcolor="#1976D2",
                 color="#FFFFFF",
@@ -83,12 +193,20 @@ class Step5Results:
                 spacing=0,
                 expand=True,
             ),
-            padding=ft.padding.all(30),
+            padding=_PADDING_30,
         )
         return self.container
     
     def show_results(self, result: ConsolidationResult):
         """Exibe os resultados da consolidação"""
+        # Mesmo resultado já renderizado: nada a refazer
+        if (
+            result is self.result
+            and self.results_container
+            and self.results_container.content is not self._empty_state_column
+        ):
+            return
+        
         self.result = result
         
         if result.success:
@@ -96,7 +214,9 @@ class Step5Results:
         else:
             self._show_error_results(result)
         
-        self.update()
+        # Apenas a subárvore de resultados mudou; o restante do passo fica fora do diff
+        if self.results_container and self.results_container.page:
+            self.results_container.update()
     
     def _show_success_results(self, result: ConsolidationResult):
         """Exibe resultados de sucesso"""
@@ -111,48 +231,24 @@ class Step5Results:
                 spacing=15,
                 alignment=ft.MainAxisAlignment.CENTER,
             ),
-            padding=ft.padding.all(15),
+            padding=_PADDING_15,
             bgcolor="#E8F5E9",
             border_radius=8,
-            border=ft.border.all(2, "#C8E6C9"),
+            border=_BORDER_SUCCESS,
         )
         
-        # Estatísticas principais
-        stats_cards = ft.Row(
-            controls=[
-                self._create_stat_card(
-                    "Arquivos Processados",
-                    str(result.total_files_processed),
-                    ft.Icons.FOLDER_OPEN,
-                    "#1976D2"
-                ),
-                self._create_stat_card(
-                    "Linhas Adicionadas",
-                    str(result.total_rows_added),
-                    ft.Icons.ADD_BOX,
-                    "#4CAF50"
-                ),
-                self._create_stat_card(
-                    "Tempo de Execução",
-                    f"{result.execution_time:.1f}s",
-                    ft.Icons.TIMER,
-                    "#FF9800"
-                ),
-                self._create_stat_card(
-                    "Formatação",
-                    "Aplicada" if self._formatting_applied(result) else "N/A",
-                    ft.Icons.PALETTE,
-                    "#9C27B0"
-                ),
-            ],
-            spacing=15,
-            alignment=ft.MainAxisAlignment.CENTER,
-        )
+        # Estatísticas principais (atualiza os valores nos cartões já existentes)
+        refs = self._stat_value_refs
+        refs["files"].value = str(result.total_files_processed)
+        refs["rows"].value = str(result.total_rows_added)
+        refs["time"].value = f"{result.execution_time:.1f}s"
+        refs["fmt"].value = "Aplicada" if self._formatting_applied(result) else "N/A"
+        stats_cards = self._stats_row
         
         # Informações do backup
         backup_info = None
         if result.backup_path:
-            backup_filename = os.path.basename(result.backup_path)
+            backup_dir, backup_filename = os.path.split(result.backup_path)
             backup_info = ft.Container(
                 content=ft.Column(
                     controls=[
@@ -169,7 +265,7 @@ class Step5Results:
                                 ft.IconButton(
                                     icon=ft.Icons.FOLDER_OPEN,
                                     tooltip="Abrir pasta do backup",
-                                    on_click=lambda e: self._open_backup_folder(result.backup_path),
+                                    on_click=lambda e, folder=backup_dir: self._open_backup_folder(folder),
                                 ),
                             ],
                             spacing=10,
@@ -177,23 +273,23 @@ class Step5Results:
                     ],
                     spacing=5,
                 ),
-                padding=ft.padding.all(15),
+                padding=_PADDING_15,
                 bgcolor="#FFF8E1",
                 border_radius=8,
-                border=ft.border.all(1, "#FFD700"),
+                border=_BORDER_BACKUP,
             )
         
         # Detalhes dos passos
         steps_details = self._create_steps_summary(result.steps)
         
         # Atualiza o container de resultados
-        controls = [success_header, ft.Container(height=20), stats_cards]
-        
-        if backup_info:
-            controls.extend([ft.Container(height=20), backup_info])
-        
-        if steps_details:
-            controls.extend([ft.Container(height=20), steps_details])
+        controls = [
+            success_header,
+            ft.Container(height=20),
+            stats_cards,
+            *((ft.Container(height=20), backup_info) if backup_info else ()),
+            *((ft.Container(height=20), steps_details) if steps_details else ()),
+        ]
         
         self.results_container.content = ft.Column(
             controls=controls,
@@ -214,46 +310,45 @@ class Step5Results:
                 spacing=15,
                 alignment=ft.MainAxisAlignment.CENTER,
             ),
-            padding=ft.padding.all(15),
+            padding=_PADDING_15,
             bgcolor="#FFEBEE",
             border_radius=8,
-            border=ft.border.all(2, "#FFCDD2"),
+            border=_BORDER_ERROR_HEADER,
         )
         
         # Lista de erros
+        # Um único Text por erro (glifo em vez de Row + Icon)
+        error_items = [
+            ft.Text(f"⚠ {error}", color="#F44336", size=12)
+            for error in result.errors
+        ]
+        
         error_list = ft.Column(
             controls=[
                 ft.Text("Erros encontrados:", weight=ft.FontWeight.BOLD, color="#F44336"),
+                _lazy_list(error_items, spacing=5),
             ],
             spacing=5,
         )
         
-        for error in result.errors:
-            error_item = ft.Row(
-                controls=[
-                    ft.Icon(ft.Icons.ERROR_OUTLINE, color="#F44336", size=16),
-                    ft.Text(error, color="#F44336", size=12),
-                ],
-                spacing=8,
-            )
-            error_list.controls.append(error_item)
-        
         error_container = ft.Container(
             content=error_list,
-            padding=ft.padding.all(15),
+            padding=_PADDING_15,
             bgcolor="#FFEBEE",
             border_radius=8,
-            border=ft.border.all(1, "#FFCDD2"),
+            border=_BORDER_ERROR,
         )
         
         # Detalhes dos passos (se houver)
         steps_details = self._create_steps_summary(result.steps)
         
         # Atualiza o container de resultados
-        controls = [error_header, ft.Container(height=20), error_container]
-        
-        if steps_details:
-            controls.extend([ft.Container(height=20), steps_details])
+        controls = [
+            error_header,
+            ft.Container(height=20),
+            error_container,
+            *((ft.Container(height=20), steps_details) if steps_details else ()),
+        ]
         
         self.results_container.content = ft.Column(
             controls=controls,
@@ -261,24 +356,19 @@ class Step5Results:
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
         )
     
-    def _create_stat_card(self, title: str, value: str, icon, color):
-        """Cria um cartão de estatística"""
+    def _create_stat_card(self, title: str, value_text: ft.Text, icon, color):
+        """Cria um cartão de estatística em torno do texto de valor informado"""
         return ft.Container(
             content=ft.Column(
                 controls=[
                     ft.Icon(icon, color=color, size=24),
-                    ft.Text(value, size=20, weight=ft.FontWeight.BOLD, color=color),
+                    value_text,
                     ft.Text(title, size=12, color="#757575", text_align=ft.TextAlign.CENTER),
                 ],
                 spacing=8,
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
-            padding=ft.padding.all(20),
-            bgcolor="#FFFFFF",
-            border_radius=10,
-            border=ft.border.all(1, "#E0E0E0"),
-            width=150,
-            height=120,
+            **_STAT_CARD_STYLE,
         )
     
     def _create_steps_summary(self, steps):
@@ -286,87 +376,62 @@ class Step5Results:
         if not steps:
             return None
         
+        step_items = [item for step in steps for item in _step_items(step)]
+        
         steps_list = ft.Column(
             controls=[
                 ft.Text("Detalhes da Execução:", weight=ft.FontWeight.BOLD),
+                _lazy_list(step_items, spacing=8),
             ],
             spacing=8,
         )
         
-        for step in steps:
-            # Ícone baseado no status
-            if step.status == "completed":
-                icon = ft.Icon(ft.Icons.CHECK_CIRCLE, color="#4CAF50", size=16)
-            elif step.status == "error":
-                icon = ft.Icon(ft.Icons.ERROR, color="#F44336", size=16)
-            else:
-                icon = ft.Icon(ft.Icons.RADIO_BUTTON_UNCHECKED, color="#9E9E9E", size=16)
-            
-            step_row = ft.Row(
-                controls=[
-                    icon,
-                    ft.Text(f"{step.id}. {step.name}", size=12),
-                    ft.Text(f"({step.progress:.0f}%)", size=11, color="#757575"),
-                ],
-                spacing=8,
-            )
-            
-            steps_list.controls.append(step_row)
-            
-            # Adiciona mensagem de erro se houver
-            if step.error_message:
-                error_text = ft.Text(
-                    f"   Erro: {step.error_message}",
-                    size=11,
-                    color="#F44336",
-                    italic=True,
-                )
-                steps_list.controls.append(error_text)
-        
         return ft.Container(
             content=steps_list,
-            padding=ft.padding.all(15),
+            padding=_PADDING_15,
             bgcolor="#ECEFF1",
             border_radius=8,
-            border=ft.border.all(1, "#CFD8DC"),
+            border=_BORDER_NEUTRAL,
             width=400,
         )
     
     def _formatting_applied(self, result: ConsolidationResult) -> bool:
-        """Verifica se a formatação foi aplicada com sucesso"""
+        """Verifica se a formatação foi aplicada com sucesso (memoizado no resultado)"""
+        cached = getattr(result, "_formatting_cache", None)
+        if cached is not None:
+            return cached
+        
         try:
-            # Verifica se o step 5 (formatação) foi concluído com sucesso
-            if result.steps:
-                formatting_step = next((step for step in result.steps if step.id == 5), None)
-                if formatting_step:
-                    return formatting_step.status == "completed" and not formatting_step.error_message
-            
-            # Se não encontrou o step, verifica se houve erros relacionados à formatação
-            if result.errors:
-                formatting_errors = [error for error in result.errors if "formatação" in error.lower()]
-                return len(formatting_errors) == 0
-            
-            return True  # Assume que foi aplicada se não há informações em contrário
+            applied = self._check_formatting(result)
         except Exception as e:
-            print(f"Erro ao verificar formatação: {e}")
+            logger.warning("Erro ao verificar formatação: %s", e)
             return False
+        
+        result._formatting_cache = applied
+        return applied
+    
+    def _check_formatting(self, result: ConsolidationResult) -> bool:
+        """Avalia os passos e erros do resultado em uma única passada cada"""
+        # Verifica se o step 5 (formatação) foi concluído com sucesso
+        if result.steps:
+            formatting_step = next((step for step in result.steps if step.id == 5), None)
+            if formatting_step:
+                return formatting_step.status == "completed" and not formatting_step.error_message
+        
+        # Se não encontrou o step, verifica se houve erros relacionados à formatação
+        if result.errors:
+            return not any("formatação" in error.casefold() for error in result.errors)
+        
+        return True  # Assume que foi aplicada se não há informações em contrário
     
-    def _open_backup_folder(self, backup_path: str):
+    def _open_backup_folder(self, folder_path: str):
         """Abre a pasta onde o backup foi salvo"""
         try:
-            import subprocess
-            import platform
-            
-            folder_path = os.path.dirname(backup_path)
-            
-            if platform.system() == "Windows":
-                subprocess.run(["explorer", folder_path])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", folder_path])
-            else:  # Linux
-                subprocess.run(["xdg-open", folder_path])
+            # Popen dispara o gerenciador de arquivos sem bloquear a thread da UI
+            subprocess_mod, command, popen_kwargs = _get_opener()
+            subprocess_mod.Popen([*command, folder_path], **popen_kwargs)
         except Exception as e:
-            print(f"Erro ao abrir pasta: {e}")
+            logger.warning("Erro ao abrir pasta: %s", e)
     
     def _handle_new_session(self, e):
         """Lida com o clique no botão de nova sessão"""
@@ -378,22 +443,9 @@ class Step5Results:
         self.result = None
         
         if self.results_container:
-            self.results_container.content = ft.Column(
-                controls=[
-                    ft.Row(
-                        controls=[
-                            ft.Icon(ft.Icons.INFO_OUTLINE, color="#42A5F5", size=18),
-                            ft.Text("Os resultados serão exibidos aqui após a consolidação", 
-                                   italic=True, color="#9E9E9E"),
-                        ],
-                        spacing=10,
-                    ),
-                ],
-                spacing=10,
-            )
+            self.results_container.content = self._empty_state_column
         
-        if self.container:
-            self.container.update()
+        self.update()
     
     def update(self):
         """Atualiza o componente"""